@@ -12,10 +12,12 @@ class GenericTorchDataset(GenericParsable, Dataset):
     """
     A generic dataset class that inherits from GenericParsable and torch.utils.data.Dataset
     """
+    __slots__ = ('_dataset_parameters', '_raw_dataset')
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
+        self.dataset_parameters = kwargs.get("dataset_parameters")
         self.raw_dataset = kwargs.get("raw_dataset")
 
     # ---------------------------------------------------------------------------------------------------------------- #
@@ -39,9 +41,10 @@ class GenericTorchDataset(GenericParsable, Dataset):
                 If the property has not been assigned.
 
         """
-        if self._dataset_parameters is None:
+        value = self._dataset_parameters
+        if value is None:
             loghandler.log_and_raise(AttributeError, "The dataset parameters have not been set.")
-        return self._dataset_parameters
+        return value
 
     @dataset_parameters.setter
     def dataset_parameters(self, input_value: Optional[GenericTorchDatasetParameters]):
@@ -58,7 +61,8 @@ class GenericTorchDataset(GenericParsable, Dataset):
         if input_value is None or isinstance(input_value, GenericTorchDatasetParameters):
             self._dataset_parameters = input_value
         else:
-            loghandler.log_and_raise(TypeError, f"Invalid input type [{type(input_value)}] for GenericTorchDatasetParameters.")
+            loghandler.log_and_raise(TypeError, "Invalid input type [", type(input_value),
+                                     "] for GenericTorchDatasetParameters.")
 
     # ---------------------------------------------------------------------------------------------------------------- #
     # --- Raw Dataset Properties ------------------------------------------------------------------------------------- #
@@ -81,9 +85,10 @@ class GenericTorchDataset(GenericParsable, Dataset):
                 If the property has not been assigned successfully.
 
         """
-        if self._raw_dataset is None:
+        value = self._raw_dataset
+        if value is None:
             loghandler.log_and_raise(AttributeError, "The raw dataset has not been set.")
-        return self._raw_dataset
+        return value
 
     @raw_dataset.setter
     @GenericTorchDatasetParameters.static_class_setter()
@@ -102,7 +107,7 @@ class GenericTorchDataset(GenericParsable, Dataset):
         if input_value is None or isinstance(input_value, pd.DataFrame):
             self._raw_dataset = input_value
         else:
-            loghandler.log_and_raise(TypeError, f"Invalid input type [{type(input_value)}] for raw dataset.")
+            loghandler.log_and_raise(TypeError, "Invalid input type [", type(input_value), "] for raw dataset.")
 
     # @abc.abstractmethod
     # def load_raw_dataset(self):
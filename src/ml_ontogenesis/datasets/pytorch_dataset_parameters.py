@@ -8,68 +8,23 @@ class GenericTorchDatasetParameters(ParametersBase):
     """
     Provides the necessary parameters for generating and loading the Torch Dataset.
     """
+    __slots__ = ('_dataset_directory',)
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
-        self._serializable_attributes.extend(['version', 'dataset_directory'])
+        self._serializable_attributes.extend(['dataset_directory'])
 
         # --- If you have special attributes that you want to define, you can define them thus ---
         # self._specialized_attributes.extend(['alpha_property', 'epsilon'])
-        self.version = kwargs.get('version')
         self.dataset_directory = kwargs.get('dataset_directory')
 
         # --- special parameters ---
         # self.alpha_parameter = kwargs.get('alpha_parameter', 'default_value')
 
     # ---------------------------------------------------------------------------------------------------------------- #
-    # --- Parsable methods ------------------------------------------------------------------------------------------- #
+    # --- Dataset Directory Properties ------------------------------------------------------------------------------- #
     # ---------------------------------------------------------------------------------------------------------------- #
-
-    @property
-    def has_version(self) -> bool:
-        """Returns whether the version has been assigned."""
-        return self._version is not None
-
-    @property
-    def version(self) -> str:
-        """
-        Gets the version of this implementation of the Parsable class.
-
-        Notes:
-            The version should be incremented for every interface change made to an implementation of the
-            Parsable class. This will allow tracking of parameter evolution with evolving data.
-
-        Returns:
-            str:
-                The version number as a string.
-
-        Raises:
-            AttributeError:
-                If the property has not been assigned yet.
-        """
-        if self._version is None:
-            loghandler.log_and_raise(AttributeError, "The dataset version has not been set.")
-        return self._version
-
-    @version.setter
-    def version(self, input_value: Optional[str]):
-        """
-        Sets the version of this implementation of the Parsable class.
-
-        Args:
-            input_value: Optional[str]
-                None or a string representation of the version.
-
-        Raises:
-            TypeError:
-                If the provided `input_value` is not a supported type.
-        """
-        if input_value is None or isinstance(input_value, str):
-            self._version = input_value
-        else:
-            loghandler.log_and_raise(TypeError, f"Invalid input type [{type(input_value)}] for dataset version.")
-
     @property
     def has_dataset_directory(self) -> bool:
         """Returns whether the directory of the dataset has been assigned."""
@@ -87,9 +42,10 @@ class GenericTorchDatasetParameters(ParametersBase):
                 If the property has not been assigned.
 
         """
-        if self._dataset_directory is None:
+        value = self._dataset_directory
+        if value is None:
             loghandler.log_and_raise(AttributeError, "The dataset directory has not been set.")
-        return self._dataset_directory
+        return value
 
     @dataset_directory.setter
     def dataset_directory(self, input_value: Optional[str]):
@@ -106,4 +62,5 @@ class GenericTorchDatasetParameters(ParametersBase):
         if input_value is None or isinstance(input_value, str):
             self._dataset_directory = input_value
         else:
-            loghandler.log_and_raise(TypeError, f"Invalid input type[{type(input_value)}] for dataset_directory.")
+            loghandler.log_and_raise(TypeError, "Invalid input type [", type(input_value),
+                                     "] for dataset_directory.")
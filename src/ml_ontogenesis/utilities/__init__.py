@@ -3,6 +3,6 @@ from . import io
 from . import plugin
 from . import properties
 from .equality import equal
-from .properties import ParsableProperty, enum_setter, parsable_setter, enum_parse
-from .parsable import Parsable, GenericParsable
+from .properties import ParsableProperty, LazyParsable, enum_setter, parsable_setter, enum_parse, materialize
+from .parsable import Parsable, GenericParsable, ImmutableParsable
 from .parameters_base import ParametersBase
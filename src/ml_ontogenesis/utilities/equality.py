@@ -2,6 +2,8 @@ from __future__ import annotations
 from typing import Any, List, Tuple, Union
 import numpy as np
 
+from .properties import materialize
+
 
 def equal(a: Any, b: Any, **kwargs) -> bool:
     """Checks if two objects are equal, using logic depending on the type.
@@ -21,6 +23,8 @@ def equal(a: Any, b: Any, **kwargs) -> bool:
         bool:
             If the two objects are equal.
     """
+    a = materialize(a)
+    b = materialize(b)
     if type(a) != type(b):
         return False
     elif isinstance(a, (List, Tuple)):
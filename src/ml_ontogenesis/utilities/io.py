@@ -1,33 +1,175 @@
+import contextlib
+import functools
 import os
+import shutil
+import stat
 import tempfile
+import time
 from pathlib import Path
-from datetime import datetime
-from distutils.dir_util import copy_tree
+from typing import Optional, Union
 import json
+import math
+import re
+import uuid
 import jsonpickle
 
+from . import properties
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover
+    msgpack = None
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover
+    ijson = None
+
+# --- prefix of the type tags jsonpickle adds to objects it cannot represent as plain JSON ---
+_PICKLE_TAG_PREFIX = "py/"
+# --- runs of digits that may be an integer beyond 64 bits, which orjson would parse as a float ---
+_LONG_DIGIT_RUN = re.compile(r"\d{19}")
+_LONG_DIGIT_RUN_BYTES = re.compile(rb"\d{19}")
+# --- placeholder standing in for RawJSON values while the surrounding document is encoded ---
+_RAW_JSON_TOKEN = "raw-json-" + uuid.uuid4().hex + "-"
+_RAW_JSON_PLACEHOLDER = re.compile('"' + _RAW_JSON_TOKEN + r'(\d+)"')
+_RAW_JSON_PLACEHOLDER_BYTES = re.compile(_RAW_JSON_PLACEHOLDER.pattern.encode())
+# --- msgpack extension type code under which Parsable objects are packed ---
+_MSGPACK_PARSABLE_CODE = 1
+
 
 # ---------------------------------------------------------------------------------------------------------------- #
 # --- File and Directory Access ---------------------------------------------------------------------------------- #
 # ---------------------------------------------------------------------------------------------------------------- #
+_STAT_CACHE_SIZE = 4096
+_SEPARATORS = os.sep + (os.altsep or "")
+# --- the stat results of existing paths, only kept while a `cached_stats` block is active ---
+_stat_cache = None
+
+
+def _stat_once(path: Union[str, bytes]) -> Optional[os.stat_result]:
+    """Returns the result of `os.stat` for an existing path, or None if the path does not exist.
+
+    Notes:
+        Inside a `cached_stats` block the results of existing paths are remembered, so repeated probes of the same path
+        share one system call. Missing paths are never remembered, so a file created in the meantime is always found.
+    """
+    cache = _stat_cache
+    result = None if cache is None else cache.get(path)
+    if result is None:
+        try:
+            result = os.stat(path)
+        except (OSError, ValueError):
+            return None
+        if cache is not None:
+            if len(cache) >= _STAT_CACHE_SIZE:
+                cache.clear()
+            cache[path] = result
+    return result
+
+
+@contextlib.contextmanager
+def cached_stats():
+    """Remembers the metadata of existing paths checked by `file_exists` and `is_dir` while the block is active.
+
+    Notes:
+        Use this around bursts of checks on paths that are not removed meanwhile. A path removed inside the block is
+        still reported as present until `invalidate_stat_cache` is called. The cache is dropped when the outermost
+        block exits.
+    """
+    global _stat_cache
+    outer = _stat_cache
+    if outer is None:
+        _stat_cache = dict()
+    try:
+        yield
+    finally:
+        if outer is None:
+            _stat_cache = None
+
+
+def invalidate_stat_cache():
+    """Forgets the metadata remembered by an active `cached_stats` block.
+
+    Notes:
+        Call this after files or directories have been moved or removed inside such a block.
+    """
+    cache = _stat_cache
+    if cache is not None:
+        cache.clear()
+
+
+def _fspath(filepath) -> Optional[Union[str, bytes]]:
+    """Returns the file system representation of a path-like object, or None if it is not path-like."""
+    try:
+        return os.fspath(filepath)
+    except TypeError:
+        return None
+
+
 def file_exists(filepath):
-    if isinstance(filepath, Path):
-        if filepath.exists():
-            return True
-    elif isinstance(filepath, str):
-        if os.path.exists(filepath):
-            return True
-    return False
+    path = _fspath(filepath)
+    return path is not None and _stat_once(path) is not None
 
 
 def is_dir(filepath):
-    if isinstance(filepath, Path):
-        if filepath.exists() and filepath.is_dir():
-            return True
-    elif isinstance(filepath, str):
-        if os.path.exists(filepath) and os.path.isdir(filepath):
-            return True
-    return False
+    path = _fspath(filepath)
+    if path is None:
+        return False
+    result = _stat_once(path)
+    return result is not None and stat.S_ISDIR(result.st_mode)
+
+
+def file_exists_many(filepaths) -> dict:
+    """Checks the existence of many paths, listing each parent directory once instead of probing every path.
+
+    Notes:
+        The names are compared as returned by the directory listing, after `os.path.normcase`. On case-insensitive
+        file systems that do not normalize case, such as the macOS default, a path differing from the stored name only
+        in case is reported as missing. Paths without a file name component, and parents that cannot be listed, are
+        checked individually with `file_exists`.
+
+    Args:
+        filepaths: Iterable
+            The path-like objects to check.
+
+    Returns:
+        dict:
+            A mapping from every input path to whether it exists.
+    """
+    result = dict()
+    by_parent = dict()
+    for filepath in filepaths:
+        path = _fspath(filepath)
+        if path is None:
+            result[filepath] = False
+            continue
+        parent, name = os.path.split(path)
+        if name in ("", ".", "..") or name in (b"", b".", b".."):
+            result[filepath] = file_exists(path)
+            continue
+        by_parent.setdefault(parent, []).append((filepath, name))
+
+    for parent, entries in by_parent.items():
+        try:
+            with os.scandir(parent or os.curdir) as listing:
+                names = {os.path.normcase(entry.name) for entry in listing}
+        except (FileNotFoundError, NotADirectoryError):
+            for filepath, _ in entries:
+                result[filepath] = False
+            continue
+        except OSError:
+            for filepath, _ in entries:
+                result[filepath] = file_exists(filepath)
+            continue
+        for filepath, name in entries:
+            result[filepath] = os.path.normcase(name) in names
+    return result
 
 
 def to_path(file_path):
@@ -38,102 +180,419 @@ def to_path(file_path):
 
 
 def path_to_dir(filepath):
-    if file_exists(filepath):
-        if is_dir(filepath):
-            return filepath
-    folders_ = list(filepath.split("/"))
-    if "" in folders_:
-        folders_.remove("")
-    if len(folders_) == 0:
-        raise RuntimeError("No folder in path: " + filepath)
-    if "." in folders_[-1]:
-        if len(folders_) == 1:
-            return "./"
-        else:
-            return folders_[-2]
-    else:
-        return folders_[-1]
+    """Returns the path itself if it is an existing directory, otherwise the name of the folder it points into.
+
+    Notes:
+        A last component containing a '.' is treated as a file name, in which case the name of its parent folder is
+        returned, or './' if the path has no parent folder.
+    """
+    if is_dir(filepath):
+        return filepath
+    path = os.fspath(filepath).rstrip(_SEPARATORS)
+    head, tail = os.path.split(path)
+    if not tail:
+        raise RuntimeError("No folder in path: " + str(filepath))
+    if "." in tail:
+        return os.path.basename(head.rstrip(_SEPARATORS)) or "./"
+    return tail
 
 
 def create_directories(filepath):
-    if isinstance(filepath, Path):
-        if not filepath.exists() and filepath.suffix == "":
-            os.makedirs(filepath)
-    elif isinstance(filepath, str):
-        if not os.path.exists(filepath):
-            os.makedirs(filepath)
+    """Creates a directory and any missing parents, doing nothing if the directory already exists.
 
+    Returns:
+        The path that was passed in.
+    """
+    path = _fspath(filepath)
+    if path is not None:
+        os.makedirs(path, exist_ok=True)
+    return filepath
 
+
+@functools.lru_cache(maxsize=1)
 def get_temp_dir():
+    """Returns the temporary directory of the platform, which is resolved once per process."""
     return tempfile.gettempdir()
 
 
 def all_subdirs_of(b='.'):
-    result = []
-    for d in os.listdir(b):
-        bd = os.path.join(b, d)
-        if os.path.isdir(bd): result.append(bd)
-    return result
+    # --- the entry type comes with the directory listing, so only symbolic links need an extra stat ---
+    with os.scandir(b) as entries:
+        return [entry.path for entry in entries if entry.is_dir()]
 
 
 def get_latest_folder(top_folder):
-    all_subdirs = all_subdirs_of(b=top_folder)
-    latest_subdir = max(all_subdirs, key=os.path.getctime)
-    return latest_subdir
+    with os.scandir(top_folder) as entries:
+        latest_subdir = max((entry for entry in entries if entry.is_dir()), key=lambda entry: entry.stat().st_ctime)
+    return latest_subdir.path
 
 
 def get_all_folders_with_subfolder(top_level, subfolder_name):
-    subdirectories = all_subdirs_of(top_level)
+    """Collects the children of every directory named `subfolder_name` below `top_level`.
+
+    Notes:
+        The tree is walked once with `os.walk`, which lists each visited directory with `os.scandir` and needs no
+        extra stat per entry. The walk does not descend into a matching directory, so folders of the same name nested
+        inside it are returned as children rather than searched again.
+
+    Returns:
+        list:
+            The paths of the subdirectories of the matching directories, in the form '<match>/<child>', in the order
+            of the walk.
+    """
     result = []
-    for d in subdirectories:
-        subsubfolders = all_subdirs_of(d)
-        for sd in subsubfolders:
-            dir_ = path_to_dir(d)
-            if dir_ == subfolder_name:
-                result.append(sd)
+    for dirpath, dirnames, _ in os.walk(top_level, topdown=True):
+        if os.path.basename(dirpath) == subfolder_name:
+            result.extend(os.path.join(dirpath, d) for d in dirnames)
+            dirnames[:] = []
     return result
 
 
 def copy_folder_contents_to(original_folder, destination_folder):
-    create_directories(destination_folder)
-    copy_tree(original_folder, destination_folder)
+    # --- shutil copies the file contents in the kernel (sendfile) where the platform supports it ---
+    shutil.copytree(original_folder, destination_folder, dirs_exist_ok=True, copy_function=shutil.copy2)
+    invalidate_stat_cache()
 
 
 # ---------------------------------------------------------------------------------------------------------------- #
 # --- Data and Time ---------------------------------------------------------------------------------------------- #
 # ---------------------------------------------------------------------------------------------------------------- #
+_DATE_TIME_FORMAT = "%Y_%m_%d-%H_%M_%S"
+
+
 def get_date_time_string():
-    _now = datetime.now()
-    return _now.strftime("%Y_%m_%d-%H_%M_%S")
+    return time.strftime(_DATE_TIME_FORMAT)
 
 
 # ---------------------------------------------------------------------------------------------------------------- #
 # --- JSON R/W --------------------------------------------------------------------------------------------------- #
 # ---------------------------------------------------------------------------------------------------------------- #
-def to_pickled_json(input_value):
+class RawJSON(str):
+    """A string holding an already encoded JSON document that the JSON writers embed verbatim instead of as a string.
+
+    Notes:
+        The caller guarantees that the string is valid JSON. It is only spliced in by `to_json_str` and
+        `write_to_json_file`; reading the document back yields the decoded value rather than a RawJSON.
+    """
+    __slots__ = ()
+
+
+def _substitute_raw_json(input_value, fragments: list):
+    """Replaces the RawJSON values within lists, tuples and dict values by placeholders, collecting them in order.
+
+    Returns:
+        The input value itself if it holds no RawJSON, otherwise a copy holding placeholders in their place.
+    """
+    value_type = type(input_value)
+    if value_type is RawJSON:
+        fragments.append(str(input_value))
+        return _RAW_JSON_TOKEN + str(len(fragments) - 1)
+    if value_type is list or value_type is tuple:
+        count = len(fragments)
+        output = [_substitute_raw_json(x, fragments) for x in input_value]
+        return input_value if len(fragments) == count else output
+    if value_type is dict:
+        count = len(fragments)
+        output = {k: _substitute_raw_json(v, fragments) for k, v in input_value.items()}
+        return input_value if len(fragments) == count else output
+    return input_value
+
+
+def _encode_json(json_obj, kwargs: dict) -> Union[str, bytes]:
+    """Encodes a JSON compatible object with orjson when it can honor the key-word arguments, else with json.
+
+    Notes:
+        RawJSON values make a document fail the plain JSON check. They are then replaced by placeholders, the
+        document is encoded again and the placeholders are substituted by the raw fragments.
+    """
+    option = _orjson_options(kwargs)
+    if option is not None and _is_plain_json(json_obj, pickled=False):
+        try:
+            return orjson.dumps(json_obj, option=option)
+        except orjson.JSONEncodeError:
+            pass
+    fragments = []
+    substituted = _substitute_raw_json(json_obj, fragments)
+    if not fragments:
+        return json.dumps(json_obj, **kwargs)
+    contents = _encode_json(substituted, kwargs)
+    if isinstance(contents, bytes):
+        return _RAW_JSON_PLACEHOLDER_BYTES.sub(lambda m: fragments[int(m.group(1))].encode(), contents)
+    return _RAW_JSON_PLACEHOLDER.sub(lambda m: fragments[int(m.group(1))], contents)
+
+
+def _is_plain_json(input_value, pickled: bool = True) -> bool:
+    """Returns whether a value only holds types that orjson encodes to the same data as the JSON encoder it replaces.
+
+    Notes:
+        The documents decode to equal values, but their text differs, see `to_json_str`.
+
+    Args:
+        input_value:
+            The value to inspect.
+        pickled: bool
+            If True, the value must be encoded by jsonpickle without type tags, which excludes tuples and keys that
+            look like type tags. If False, the value must be encoded by the standard library json module.
+    """
+    value_type = type(input_value)
+    if value_type is str or value_type is int or value_type is bool or input_value is None:
+        return True
+    if value_type is float:
+        return math.isfinite(input_value)
+    if value_type is list or (value_type is tuple and not pickled):
+        return all(_is_plain_json(x, pickled) for x in input_value)
+    if value_type is dict:
+        return all(type(k) is str and not (pickled and k.startswith(_PICKLE_TAG_PREFIX)) and _is_plain_json(v, pickled)
+                   for k, v in input_value.items())
+    return False
+
+
+def _orjson_options(kwargs: dict) -> Optional[int]:
+    """Maps the key-word arguments of `json.dump` to orjson options, or returns None if orjson cannot honor them."""
+    if orjson is None:
+        return None
+    option = 0
+    for key, value in kwargs.items():
+        if key == "indent":
+            if value == 2:
+                option |= orjson.OPT_INDENT_2
+            elif value is not None:
+                return None
+        elif key == "sort_keys":
+            if value:
+                option |= orjson.OPT_SORT_KEYS
+        else:
+            return None
+    return option
+
+
+def _orjson_can_read(input_value: Union[str, bytes]) -> bool:
+    """Returns whether orjson can be used to parse a JSON document without altering integers beyond 64 bits."""
+    long_digit_run = _LONG_DIGIT_RUN_BYTES if isinstance(input_value, bytes) else _LONG_DIGIT_RUN
+    return orjson is not None and long_digit_run.search(input_value) is None
+
+
+def _has_pickle_tags(input_value) -> bool:
+    """Returns whether a decoded JSON structure contains any jsonpickle type tags."""
+    if isinstance(input_value, dict):
+        return any(k.startswith(_PICKLE_TAG_PREFIX) or _has_pickle_tags(v) for k, v in input_value.items())
+    if isinstance(input_value, list):
+        return any(_has_pickle_tags(x) for x in input_value)
+    return False
+
+
+def _encode_pickled_json(input_value) -> Union[str, bytes]:
+    """Encodes a python object with orjson when it only holds plain JSON data, else with jsonpickle."""
+    if orjson is not None and _is_plain_json(input_value):
+        try:
+            return orjson.dumps(input_value)
+        except orjson.JSONEncodeError:
+            # --- e.g. integers that do not fit into 64 bits ---
+            pass
     return jsonpickle.encode(input_value)
 
 
-def from_pickled_json(input_value):
-    return jsonpickle.decode(input_value)
+def to_pickled_json(input_value):
+    """Encodes a python object into a JSON string that can be decoded back into the same object.
 
+    Notes:
+        Plain JSON data is encoded with orjson when it is installed, as it decodes to the same data as the document of
+        jsonpickle. The text is not identical, for the reasons listed in `to_json_str`. Any other object is encoded by
+        jsonpickle.
+    """
+    contents = _encode_pickled_json(input_value)
+    return contents.decode() if isinstance(contents, bytes) else contents
 
-def read_json_file(file, **kwargs):
-    with open(file, "r") as f:
-        return json.load(f, **kwargs)
 
+def to_pickled_json_bytes(input_value) -> bytes:
+    """Encodes a python object into the UTF-8 bytes of `to_pickled_json`, without decoding the output of orjson."""
+    contents = _encode_pickled_json(input_value)
+    return contents if isinstance(contents, bytes) else contents.encode()
 
-def write_to_json_file(file, json_obj, **kwargs):
-    with open(file, "w") as f:
-        json.dump(json_obj, f, **kwargs)
+
+def from_pickled_json(input_value):
+    """Decodes the output of `to_pickled_json` back into a python object.
+
+    Notes:
+        The JSON document is parsed with orjson when it is installed. jsonpickle is only used to restore the parsed
+        structure if it contains jsonpickle type tags, or to parse documents orjson would not read back exactly, such
+        as NaN values or very large integers. An already decoded dict or list is restored directly.
+    """
+    if isinstance(input_value, (str, bytes)):
+        if not _orjson_can_read(input_value):
+            return jsonpickle.decode(input_value)
+        try:
+            input_value = orjson.loads(input_value)
+        except orjson.JSONDecodeError:
+            # --- e.g. NaN or Infinity, which jsonpickle writes but strict JSON parsers reject ---
+            return jsonpickle.decode(input_value)
+    if not _has_pickle_tags(input_value):
+        return input_value
+    return jsonpickle.Unpickler().restore(input_value, reset=True)
+
+
+def read_json_file(file, **kwargs):
+    """Reads a JSON file.
+
+    Notes:
+        The file is parsed with orjson when it is installed and no key-word arguments are given. Documents orjson would
+        not read back exactly, such as NaN values or very large integers, are parsed with the json module.
+    """
+    if orjson is None or kwargs:
+        with open(file, "r") as f:
+            return json.load(f, **kwargs)
+    with open(file, "rb") as f:
+        contents = f.read()
+    return from_json_str(contents)
+
+
+def iter_json_items(file):
+    """Iterates over the key and value pairs of the top level object of a JSON file.
+
+    Notes:
+        When ijson is installed the file is parsed incrementally, so the document is never held in memory as a whole;
+        only one top level value is materialized at a time. Without ijson the file is read by `read_json_file`.
+    """
+    if ijson is None:
+        yield from read_json_file(file).items()
+        return
+    with open(file, "rb") as f:
+        yield from ijson.kvitems(f, "", use_float=True)
+
+
+def _write_bytes(file, contents: bytes, sync: bool = False):
+    """Writes bytes to a file through a raw file descriptor, looping until the operating system accepted all of them.
+
+    Args:
+        file:
+            The path of the file to create or truncate.
+        contents: bytes
+            The encoded contents of the file.
+        sync: bool
+            If True, the file is opened with O_DSYNC where available so that the write returns only once the data
+            reached the storage device.
+    """
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    if sync:
+        flags |= getattr(os, "O_DSYNC", 0)
+    fd = os.open(file, flags, 0o666)
+    try:
+        view = memoryview(contents)
+        written = 0
+        while written < len(view):
+            written += os.write(fd, view[written:])
+    finally:
+        os.close(fd)
+
+
+def write_to_json_file(file, json_obj, sync: bool = False, **kwargs):
+    """Writes a JSON compatible object to a file.
+
+    Notes:
+        The object is written with orjson when it is installed, when it only holds plain JSON types and finite floats,
+        and when the key-word arguments are limited to `indent=2` and `sort_keys`. Otherwise the json module is used.
+        The file content of orjson differs from that of the json module as described in `to_json_str`. RawJSON
+        values are written verbatim. The encoded document is written as UTF-8 with a single `os.write` in
+        the common case, and `sync=True` additionally waits for the data to reach the storage device.
+    """
+    contents = _encode_json(json_obj, kwargs)
+    if not isinstance(contents, bytes):
+        contents = contents.encode()
+    _write_bytes(file, contents, sync=sync)
 
 
 # ---------------------------------------------------------------------------------------------------------------- #
 # --- Serialization ---------------------------------------------------------------------------------------------- #
 # ---------------------------------------------------------------------------------------------------------------- #
 def from_json_str(input_str, **kwargs):
+    """Parses a JSON document from a string or bytes.
+
+    Notes:
+        orjson parses the document when it is installed and no key-word arguments are given. Key-word arguments such
+        as `object_hook` are never dropped: the call is routed to `json.loads` instead, as are documents holding NaN
+        values or integers beyond 64 bits.
+    """
+    if not kwargs and _orjson_can_read(input_str):
+        try:
+            return orjson.loads(input_str)
+        except orjson.JSONDecodeError:
+            # --- e.g. NaN or Infinity, which the json module accepts ---
+            pass
     return json.loads(input_str, **kwargs)
 
 
 def to_json_str(json_obj, **kwargs):
-    return json.dumps(json_obj, **kwargs)
+    """Serializes a JSON compatible object into a string.
+
+    Notes:
+        orjson serializes the object when it is installed, when the key-word arguments are limited to `indent=2` and
+        `sort_keys`, and when the object only holds plain JSON types and finite floats. Otherwise `json.dumps` is used,
+        so its errors are unchanged for values orjson cannot encode. RawJSON values are embedded verbatim.
+
+        The output of orjson decodes to the same data, but it is not the text `json.dumps` writes:
+            - no space follows the ',' and ':' separators of a single-line document
+            - non-ASCII characters are written as UTF-8 instead of '\\u' escapes
+            - exponents of floats have no '+' sign, e.g. 1e16 instead of 1e+16
+        Passing an argument orjson does not support, such as `ensure_ascii=True`, routes the call to `json.dumps`,
+        whose output is then returned byte for byte.
+    """
+    contents = _encode_json(json_obj, kwargs)
+    return contents.decode() if isinstance(contents, bytes) else contents
+
+
+def to_json_bytes(json_obj, **kwargs) -> bytes:
+    """Serializes a JSON compatible object into the UTF-8 bytes of `to_json_str`.
+
+    Notes:
+        The bytes produced by orjson are returned as they are, which saves decoding them into a string and encoding
+        that string again, e.g. when the document is sent over a socket.
+    """
+    contents = _encode_json(json_obj, kwargs)
+    return contents if isinstance(contents, bytes) else contents.encode()
+
+
+# ---------------------------------------------------------------------------------------------------------------- #
+# --- MessagePack ------------------------------------------------------------------------------------------------ #
+# ---------------------------------------------------------------------------------------------------------------- #
+def _encode_msgpack_parsable(input_value):
+    """Packs an object exposing `to_dict`, such as a Parsable, into a msgpack extension type."""
+    if not hasattr(input_value, 'to_dict'):
+        raise TypeError("Unable to pack an object of type [" + type(input_value).__name__ + "] with msgpack.")
+    return msgpack.ExtType(_MSGPACK_PARSABLE_CODE, to_msgpack(input_value.to_dict()))
+
+
+def _decode_msgpack_parsable(code: int, data: bytes):
+    """Restores a Parsable from the msgpack extension type written by `_encode_msgpack_parsable`."""
+    if code != _MSGPACK_PARSABLE_CODE:
+        return msgpack.ExtType(code, data)
+    return properties.ParsableProperty.parse(from_msgpack(data), throw_if_unable_to_parse=True)
+
+
+def to_msgpack(input_value) -> bytes:
+    """Packs a python object into MessagePack bytes.
+
+    Notes:
+        Plain data is packed natively, with tuples packed as lists. Parsable objects are packed through their
+        `to_dict` representation, which holds their class and module names, and are reconstructed by `from_msgpack`.
+
+    Raises:
+        ImportError:
+            If msgpack is not installed.
+        TypeError:
+            If the object holds values that are neither plain data nor Parsable objects.
+    """
+    if msgpack is None:
+        raise ImportError("msgpack is required to pack objects into MessagePack.")
+    return msgpack.packb(input_value, use_bin_type=True, default=_encode_msgpack_parsable)
+
+
+def from_msgpack(input_value: bytes):
+    """Unpacks MessagePack bytes written by `to_msgpack` back into python objects.
+
+    Raises:
+        ImportError:
+            If msgpack is not installed.
+    """
+    if msgpack is None:
+        raise ImportError("msgpack is required to unpack MessagePack data.")
+    return msgpack.unpackb(input_value, raw=False, strict_map_key=False, ext_hook=_decode_msgpack_parsable)
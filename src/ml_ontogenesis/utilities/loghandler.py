@@ -1,6 +1,16 @@
-import inspect
+from __future__ import annotations
+from typing import TYPE_CHECKING
+import atexit
 import logging
-from typing import Type, Optional, NoReturn
+import logging.handlers
+import os
+import queue
+import sys
+import weakref
+
+if TYPE_CHECKING:
+    from types import FrameType
+    from typing import Type, Optional, NoReturn, Tuple
 
 
 # --- Logging Levels ---
@@ -13,11 +23,132 @@ INFO = logging.INFO
 DEBUG = logging.DEBUG
 NOTSET = logging.NOTSET
 
+# --- Asynchronous Logging ---
+_ASYNC_LOG_VARIABLE = "ML_ONTOGENESIS_ASYNC_LOG"
+_ASYNC_LOG_QUEUE_SIZE = 10000
+
+# --- Stream Buffering ---
+_BUFFERED_LOG_VARIABLE = "ML_ONTOGENESIS_BUFFERED_LOG"
+_STREAM_BUFFER_SIZE = 65536
+
+# --- Message Formats ---
+_RECORD_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+_LOCATION_FORMAT = '"%s:%d" - in [%s] --- %s'
+
+
+# --- the buffered handlers, which are flushed before the process forks ---
+_buffered_handlers = weakref.WeakSet()
+
+
+class _BufferedStreamHandler(logging.StreamHandler):
+    """A StreamHandler that lets its stream buffer records and only flushes on records of a minimum severity.
+
+    Notes:
+        Buffered records are written out by the flush that `logging.shutdown` performs when the interpreter exits.
+        The buffer is flushed before the process forks, and forked children flush every record, since they usually
+        exit through `os._exit` without a shutdown.
+    """
+
+    def __init__(self, stream, flush_level: int = WARNING):
+        super().__init__(stream)
+        self.flush_level = flush_level
+        _buffered_handlers.add(self)
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            if record.levelno >= self.flush_level:
+                self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+def _flush_buffered_handlers():
+    """Writes out the records buffered by every buffered handler, so that a forked child does not inherit them."""
+    for handler in list(_buffered_handlers):
+        handler.flush()
+
+
+def _unbuffer_handlers_in_child():
+    """Makes the buffered handlers of a forked child flush every record, as the child may never flush them."""
+    for handler in list(_buffered_handlers):
+        handler.flush_level = NOTSET
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(before=_flush_buffered_handlers, after_in_child=_unbuffer_handlers_in_child)
+
+
+def _create_stream_handler() -> logging.Handler:
+    """Creates the handler writing to stderr, batching writes if requested and stderr is not an interactive terminal.
+
+    Notes:
+        Batching is opt-in through the environment variable `ML_ONTOGENESIS_BUFFERED_LOG=1`, since buffered records
+        below WARNING are written late and bypass redirections of `sys.stderr`. The stderr file descriptor is then
+        duplicated so that closing the buffered stream never closes `sys.stderr`. Otherwise, or when stderr is a
+        terminal or has no usable file descriptor, a regular unbuffered StreamHandler is returned.
+    """
+    if os.environ.get(_BUFFERED_LOG_VARIABLE) != "1":
+        return logging.StreamHandler()
+    try:
+        fd = sys.stderr.fileno()
+        if os.isatty(fd):
+            return logging.StreamHandler()
+        fd = os.dup(fd)
+    except (AttributeError, OSError, ValueError):
+        return logging.StreamHandler()
+    stream = open(fd, "w", buffering=_STREAM_BUFFER_SIZE, encoding=getattr(sys.stderr, "encoding", None) or "utf-8",
+                  errors="backslashreplace")
+    return _BufferedStreamHandler(stream)
+
+
+class _BlockingQueueHandler(logging.handlers.QueueHandler):
+    """A QueueHandler that waits for space in a bounded queue instead of dropping the record."""
+
+    def enqueue(self, record: logging.LogRecord):
+        self.queue.put(record)
+
+
+def _start_queue_listener(handler: logging.Handler) -> logging.Handler:
+    """Moves the emission of records onto a background listener thread.
+
+    Notes:
+        Records still queued when the process exits abnormally are lost, which is why this path is opt-in.
+
+    Args:
+        handler: logging.Handler
+            The handler that should emit the records from the listener thread.
+
+    Returns:
+        logging.Handler:
+            The handler to attach to the logger, which only enqueues records.
+    """
+    record_queue = queue.Queue(maxsize=_ASYNC_LOG_QUEUE_SIZE)
+    listener = logging.handlers.QueueListener(record_queue, handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    return _BlockingQueueHandler(record_queue)
+
 
 def _create_logger(logger_name: str):
+    """Creates the package logger with its own stream handler, leaving the root logger of the process untouched.
+
+    Notes:
+        Setting the environment variable `ML_ONTOGENESIS_ASYNC_LOG=1` emits the records from a background thread so
+        that formatting and writing do not happen in the thread issuing the log call. Setting
+        `ML_ONTOGENESIS_BUFFERED_LOG=1` batches the writes to a non-interactive stderr.
+    """
     _logger = logging.getLogger(logger_name)
     _logger.setLevel(logging.INFO)
-    logging.basicConfig(format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    if not _logger.handlers:
+        handler = _create_stream_handler()
+        handler.setFormatter(logging.Formatter(_RECORD_FORMAT))
+        if os.environ.get(_ASYNC_LOG_VARIABLE) == "1":
+            handler = _start_queue_listener(handler)
+        _logger.addHandler(handler)
+    _logger.propagate = False
     return _logger
 
 
@@ -32,27 +163,37 @@ def set_log_level(level: int):
     __logger__.setLevel(level)
 
 
-def function_file_line(message: str, stack=inspect.stack()[0]):
-    """Gets the function name, file and line number from FrameInfo"""
-    caller = inspect.getframeinfo(stack[0])
-    _message = "\"" + str(caller.filename) + ":" + str(caller.lineno) + "\" - in [" + str(
-        caller.function) + "] --- " + message
-    return _message
+def function_file_line(message: str, stack: FrameType) -> Tuple[str, tuple]:
+    """Gets the function name, file and line number from a frame.
+
+    Notes:
+        The frame attributes are read directly rather than through `inspect.getframeinfo`, which performs a source
+        lookup and stats the file on every call. A `inspect.FrameInfo` is also accepted for backwards compatibility.
+
+    Returns:
+        Tuple[str, tuple]:
+            A printf-style format string and the arguments to format it with.
+    """
+    frame = getattr(stack, 'frame', stack)
+    code = frame.f_code
+    return _LOCATION_FORMAT, (code.co_filename, frame.f_lineno, code.co_name, message)
 
 
-def log(*argv, level: int, record_location: bool = False, stack=inspect.stack()[1]) -> str:
-    message = ""
-    if not __logger__.isEnabledFor(level):
-        return message
-    for arg in argv:
-        message += str(arg)
+def log(*argv, level: int, record_location: bool = False, stack: Optional[FrameType] = None) -> str:
+    enabled = __logger__.isEnabledFor(level)
+    if not enabled:
+        return ""
+    message = "".join(map(str, argv))
+    # --- the frame is only inspected for records that will be emitted ---
     if record_location:
-        message = function_file_line(message=message, stack=stack)
-    __logger__.log(level=level, msg=message)
+        location_format, location_args = function_file_line(message=message,
+                                                            stack=stack if stack is not None else sys._getframe(1))
+        message = location_format % location_args
+    __logger__.log(level, message)
     return message
 
 
-def debug(*argv, record_location: bool = False, stack: Optional[inspect.FrameInfo] = None) -> str:
+def debug(*argv, record_location: bool = False, stack: Optional[FrameType] = None) -> str:
     """Log to the DEBUG stream.
 
     Args:
@@ -65,12 +206,11 @@ def debug(*argv, record_location: bool = False, stack: Optional[inspect.FrameInf
     """
     if not __logger__.isEnabledFor(DEBUG):
         return ""
-    return log(*argv, level=logging.DEBUG,
-               record_location=record_location,
-               stack=stack if stack is not None or not record_location else inspect.stack()[1])
+    return log(*argv, level=DEBUG, record_location=record_location,
+               stack=stack if stack is not None or not record_location else sys._getframe(1))
 
 
-def info(*argv, record_location: bool = False, stack: Optional[inspect.FrameInfo] = None) -> str:
+def info(*argv, record_location: bool = False, stack: Optional[FrameType] = None) -> str:
     """Log to the INFO stream.
 
     Args:
@@ -83,12 +223,11 @@ def info(*argv, record_location: bool = False, stack: Optional[inspect.FrameInfo
     """
     if not __logger__.isEnabledFor(INFO):
         return ""
-    return log(*argv, level=logging.INFO,
-               record_location=record_location,
-               stack=stack if stack is not None or not record_location else inspect.stack()[1])
+    return log(*argv, level=INFO, record_location=record_location,
+               stack=stack if stack is not None or not record_location else sys._getframe(1))
 
 
-def warning(*argv, record_location: bool = False, stack: Optional[inspect.FrameInfo] = None) -> str:
+def warning(*argv, record_location: bool = False, stack: Optional[FrameType] = None) -> str:
     """Log to the WARNING stream.
 
     Args:
@@ -101,12 +240,11 @@ def warning(*argv, record_location: bool = False, stack: Optional[inspect.FrameI
     """
     if not __logger__.isEnabledFor(WARNING):
         return ""
-    return log(*argv, level=logging.WARNING,
-               record_location=record_location,
-               stack=stack if stack is not None or not record_location else inspect.stack()[1])
+    return log(*argv, level=WARNING, record_location=record_location,
+               stack=stack if stack is not None or not record_location else sys._getframe(1))
 
 
-def error(*argv, record_location: bool = False, stack: Optional[inspect.FrameInfo] = None) -> str:
+def error(*argv, record_location: bool = False, stack: Optional[FrameType] = None) -> str:
     """Log to the ERROR stream.
 
     Args:
@@ -119,10 +257,11 @@ def error(*argv, record_location: bool = False, stack: Optional[inspect.FrameInf
     """
     if not __logger__.isEnabledFor(ERROR):
         return ""
-    return log(*argv, level=logging.ERROR, record_location=record_location, stack=stack if stack is not None or not record_location else inspect.stack()[1])
+    return log(*argv, level=ERROR, record_location=record_location,
+               stack=stack if stack is not None or not record_location else sys._getframe(1))
 
 
-def critical(*argv, record_location: bool = False, stack: Optional[inspect.FrameInfo] = None) -> str:
+def critical(*argv, record_location: bool = False, stack: Optional[FrameType] = None) -> str:
     """Log to the CRITICAL stream.
 
     Args:
@@ -135,12 +274,19 @@ def critical(*argv, record_location: bool = False, stack: Optional[inspect.Frame
     """
     if not __logger__.isEnabledFor(CRITICAL):
         return ""
-    return log(*argv, level=logging.CRITICAL, record_location=record_location, stack=stack if stack is not None or not record_location else inspect.stack()[1])
+    return log(*argv, level=CRITICAL, record_location=record_location,
+               stack=stack if stack is not None or not record_location else sys._getframe(1))
 
 
-def log_and_raise(exception_type: Type[Exception], *args, record_location: bool = True, **kwargs) -> NoReturn:
+
+def log_and_raise(exception_type: Type[Exception], *args, record_location: bool = True,
+                  cause: Optional[BaseException] = None, **kwargs) -> NoReturn:
     """Raise an exception immediately after logging its message to the ERROR stream.
 
+    Notes:
+        The calling frame is only looked up when the ERROR level is enabled. When it is disabled, the exception still
+        carries the concatenated message without its location.
+
     Args:
         exception_type: type
             The type of Exception to raise.
@@ -148,6 +294,8 @@ def log_and_raise(exception_type: Type[Exception], *args, record_location: bool
             Arguments to concatenate into a string log message.
         record_location: bool
             Record the stack frame from which this log method was invoked iff True.
+        cause: Optional[BaseException]
+            The exception chained as the `__cause__` of the raised one, if any.
         kwargs: dict
             Keyword arguments to `error`.
             Only `record_location` is supported as of Feb 2024
@@ -157,4 +305,12 @@ def log_and_raise(exception_type: Type[Exception], *args, record_location: bool
         Exception:
               A subclass of type `exception_type`. Guaranteed to raise.
     """
-    raise exception_type(error(*args, record_location=record_location, stack=inspect.stack()[1]))
+    message = "".join(map(str, args))
+    if __logger__.isEnabledFor(ERROR):
+        if record_location:
+            location_format, location_args = function_file_line(message=message, stack=sys._getframe(1))
+            message = location_format % location_args
+        __logger__.error(message)
+    if cause is not None:
+        raise exception_type(message) from cause
+    raise exception_type(message)
@@ -3,17 +3,37 @@ from typing import Union, Any, Optional
 
 from . import loghandler, io, parsable, plugin
 
+# --- values of these types are immutable and can be shared between copies ---
+_IMMUTABLE_TYPES = frozenset((int, float, complex, str, bytes, bool, type(None), frozenset))
+
+
+def _copy_value(value: Any, memo: dict) -> Any:
+    """Deep copies a value, sharing immutable scalars and copying lists of them without the deepcopy machinery."""
+    value_type = type(value)
+    if value_type in _IMMUTABLE_TYPES:
+        return value
+    if value_type is list and all(type(x) in _IMMUTABLE_TYPES for x in value):
+        return list(value)
+    return copy.deepcopy(value, memo)
+
 
 class ParametersBase(parsable.GenericParsable, plugin.PluginBase):
     """
     Represents the base class for all configurable input parameters.
+
+    Notes:
+        The attributes of the class hierarchy are stored in `__slots__`. Subclasses should declare the private
+        attributes backing their properties in their own `__slots__`; otherwise their instances fall back to carrying
+        an instance `__dict__`. The registered attribute lists such as `_serializable_attributes` are slots of each
+        instance, so registering attributes in `__init__` never affects other instances.
     """
+    __slots__ = ('_debug',)
 
     def __init__(self, *args, **kwargs):
         # --- init the parent ---
         super().__init__(*args, **kwargs)
         # --- update the parsable attributes ---
-        self._serializable_attributes.extend(['debug'])
+        self._serializable_attributes.append('debug')
 
         # --- general attributes ---
         self.debug = kwargs.get('debug', False)
@@ -23,21 +43,27 @@ class ParametersBase(parsable.GenericParsable, plugin.PluginBase):
     # ---------------------------------------------------------------------------------------------------------------- #
     @staticmethod
     def create_parameters(parameters_type: str,
-                          arguments: Union[str, dict],
+                          arguments: Union[str, bytes, dict],
                           parse_instead_of_construct: bool = False,
-                          pickled: bool = False):
+                          pickled: bool = False,
+                          format: str = "json"):
         """Creates a subclass implementation of the ParametersBase class.
 
         Args:
             parameters_type: str
                 The name of the subclass implementation.
-            arguments: Union[str, dict]
-                Arguments to use for either construction or parsing of the implementation's information.
+            arguments: Union[str, bytes, dict]
+                Arguments to use for either construction or parsing of the implementation's information. A str or
+                bytes argument is decoded according to `format`.
             parse_instead_of_construct: bool
                 Whether to use the input arguments an inputs to the constructor or parse them as a json object if the
                 arguments are a dict.
             pickled: bool
-                Whether the arguments are pickled if the input argument is a str.
+                Whether the arguments are pickled if the input argument is a str or bytes. For the 'msgpack' format,
+                whether the arguments hold a packed Parsable.
+            format: str
+                The encoding of a str or bytes argument: 'json' for JSON text, as written by `io.to_json_str` or
+                `io.to_json_bytes`, or 'msgpack' for MessagePack bytes written by `io.to_msgpack`.
 
         Returns:
             ParametersBaseType:
@@ -45,30 +71,59 @@ class ParametersBase(parsable.GenericParsable, plugin.PluginBase):
 
         Raises:
             TypeError:
-                If the 'arguments' aren't a supported input type.
+                If the 'arguments' aren't a supported input type, or aren't bytes for the 'msgpack' format.
+            ValueError:
+                If the 'format' is neither 'json' nor 'msgpack'.
         """
-        if isinstance(arguments, dict):
+        if format != "json" and format != "msgpack":
+            loghandler.log_and_raise(ValueError, "Invalid arguments format [", format, "].")
+        arguments_type = type(arguments)
+        if arguments_type is dict or (arguments_type is not str and isinstance(arguments, dict)):
             if pickled:
                 return io.from_pickled_json(arguments)
+            parameters_class = ParametersBase._lookup_parameters_class(parameters_type, arguments)
             if not parse_instead_of_construct:
-                return ParametersBase.construct(parameters_type, **arguments)
+                return parameters_class(**arguments)
             else:
-                output = ParametersBase.construct(parameters_type)
+                output = parameters_class()
                 output.from_json(arguments)
                 return output
-        elif isinstance(arguments, str):
-            args = io.from_json_str(arguments)
-            if pickled:
-                return io.from_pickled_json(args)
+        elif arguments_type is str or arguments_type is bytes or isinstance(arguments, (str, bytes)):
+            if format == "msgpack":
+                if not isinstance(arguments, bytes):
+                    loghandler.log_and_raise(TypeError, "MessagePack arguments must be bytes, not [", type(arguments),
+                                             "].")
+                args = io.from_msgpack(arguments)
+                if pickled:
+                    return args
+            elif pickled:
+                return io.from_pickled_json(arguments)
+            else:
+                args = io.from_json_str(arguments)
+            parameters_class = ParametersBase._lookup_parameters_class(parameters_type, args)
             if not parse_instead_of_construct:
-                return ParametersBase.construct(parameters_type, **args)
+                return parameters_class(**args)
             else:
-                output = ParametersBase.construct(parameters_type)
+                output = parameters_class()
                 output.from_json(args)
                 return output
         else:
             loghandler.log_and_raise(TypeError, "Invalid input arguments type [", type(arguments), "].")
 
+    @staticmethod
+    def _lookup_parameters_class(parameters_type: str, arguments: dict) -> type:
+        """Looks up the ParametersBase implementation named `parameters_type`.
+
+        Notes:
+            Registered implementations are found with a single lookup in the plugin registry, so the result is not
+            memoized. The module named in `arguments` is only used for implementations that are not registered.
+
+        Raises:
+            RuntimeError:
+                If no implementation with the given name can be found.
+        """
+        return ParametersBase.lookup(parameters_type, None, arguments)
+
     # ---------------------------------------------------------------------------------------------------------------- #
     # --- Manipulation ----------------------------------------------------------------------------------------------- #
     # ---------------------------------------------------------------------------------------------------------------- #
@@ -85,10 +140,39 @@ class ParametersBase(parsable.GenericParsable, plugin.PluginBase):
             Any:
                 The type of implementation of this ParametersBase class.
         """
-        copied_parameters = copy.deepcopy(self)
+        copied_parameters = self._clone()
         copied_parameters.update(only_if_missing, kwargs)
         return copied_parameters
 
+    def _clone(self) -> Any:
+        """Creates a deep copy of these parameters without going through `copy.deepcopy` for the object itself.
+
+        Notes:
+            The slots and instance dictionary entries are copied directly. Immutable scalars are shared, lists of
+            scalars such as the registered attribute names are shallow copied, and any other value is deep copied.
+            Unlike `copy.deepcopy`, a list of scalars referenced by several attributes is copied once per attribute,
+            so the copies no longer share it. Implementations defining `__deepcopy__` are copied by `copy.deepcopy`.
+
+        Returns:
+            Any:
+                A new instance of the same ParametersBase implementation holding copies of the attributes.
+        """
+        class_type = type(self)
+        if getattr(class_type, '__deepcopy__', None) is not None:
+            return copy.deepcopy(self)
+        clone = class_type.__new__(class_type)
+        memo = {id(self): clone}
+        for descriptor in parsable.slot_descriptors(class_type):
+            try:
+                value = descriptor.__get__(self, class_type)
+            except AttributeError:
+                continue
+            descriptor.__set__(clone, _copy_value(value, memo))
+        instance_dict = getattr(self, '__dict__', None)
+        if instance_dict:
+            clone.__dict__.update((k, _copy_value(v, memo)) for k, v in instance_dict.items())
+        return clone
+
     # ---------------------------------------------------------------------------------------------------------------- #
     # --- Debug Properties ------------------------------------------------------------------------------------------- #
     # ---------------------------------------------------------------------------------------------------------------- #
@@ -109,9 +193,10 @@ class ParametersBase(parsable.GenericParsable, plugin.PluginBase):
             AttributeError:
                 If the property has not been assigned yet.
         """
-        if self._debug is None:
+        value = self._debug
+        if value is None:
             loghandler.log_and_raise(AttributeError, "The debug parameter has not been set.")
-        return self._debug
+        return value
 
     @debug.setter
     def debug(self, input_value: Optional[bool]):
@@ -125,7 +210,8 @@ class ParametersBase(parsable.GenericParsable, plugin.PluginBase):
             TypeError:
                 If the provided `input_value` is not a supported type.
         """
-        if input_value is None or isinstance(input_value, bool):
+        # --- bool has exactly two instances, so identity checks replace the isinstance call ---
+        if input_value is None or input_value is True or input_value is False:
             self._debug = input_value
         else:
             loghandler.log_and_raise(TypeError, "Invalid input type [", type(input_value), "].")
@@ -1,20 +1,420 @@
 # --- external imports ---
 from __future__ import annotations
-from typing import List, Optional, Tuple, Union, Any, Sequence
-from abc import abstractmethod, ABCMeta
-import numpy as np
+from typing import Callable, Iterable, List, Optional, Tuple, Union, Any, Sequence
+import concurrent.futures
+import functools
+import itertools
+import os
+import sys
+import threading
+import types
 from pathlib import Path
 
+import numpy as np
+
 from . import io, loghandler, properties
+from .equality import equal
+
+# --- default of input lookups that must tell a missing attribute apart from an attribute serialized as None ---
+_MISSING = object()
+
+@functools.lru_cache(maxsize=4096)
+def _encoder_name(value_type: type) -> Optional[str]:
+    """Returns the name of the method that serializes values of the given type, or None if they are kept as is.
+
+    Notes:
+        The name is memoized per type in a bounded cache, so the types of serialized values are not kept alive
+        indefinitely.
+    """
+    if hasattr(value_type, 'to_dict'):
+        return 'to_dict'
+    if hasattr(value_type, 'tolist'):
+        return 'tolist'
+    return None
+
+
+@functools.lru_cache(maxsize=4096)
+def _presence_name(class_type: type, property_name: str) -> Optional[str]:
+    """Returns the name of the 'has_' property of an attribute if the class defines one, memoized per class."""
+    name = "has_" + property_name
+    return name if hasattr(class_type, name) else None
+
+
+@functools.lru_cache(maxsize=4096)
+def _decoder_name(class_type: type, property_name: str) -> Optional[str]:
+    """Returns the name of the '_decode' method of an attribute if the class defines one, memoized per class."""
+    name = property_name + "_decode"
+    return name if hasattr(class_type, name) else None
+
+
+@functools.lru_cache(maxsize=4096)
+def _updater_name(class_type: type, property_name: str) -> Optional[str]:
+    """Returns the name of the 'update_' method of an attribute if the class defines one, memoized per class."""
+    name = "update_" + property_name
+    return name if callable(getattr(class_type, name, None)) else None
+
+
+def _serialized_value(value: Any) -> Any:
+    """Serializes a value through its 'to_dict()' or 'tolist()' method, returning values without either as is."""
+    name = _encoder_name(type(value))
+    if name is None:
+        return value
+    return getattr(value, name)()
+
+
+@functools.lru_cache(maxsize=None)
+def slot_descriptors(class_type: type) -> Tuple[types.MemberDescriptorType, ...]:
+    """Collects the descriptors of all slots declared by a class and its bases."""
+    return tuple(value for klass in class_type.__mro__ for value in vars(klass).values()
+                 if isinstance(value, types.MemberDescriptorType))
+
+
+def _stable_list(value) -> list:
+    """Lists the items of a set in sorted order, or in iteration order if they cannot be compared to each other."""
+    try:
+        return sorted(value)
+    except TypeError:
+        return list(value)
+
+
+def _parsed_value(value: Any, lazy: bool, _parsable_type: str = properties.generic_parsable_type) -> Any:
+    """Parses a value holding the class marker of a serialized Parsable and returns any other value as is."""
+    if isinstance(value, dict) and _parsable_type in value:
+        if lazy:
+            return properties.LazyParsable(value)
+        return properties.ParsableProperty.parse(value, throw_if_unable_to_parse=True)
+    return value
+
+
+# ---------------------------------------------------------------------------------------------------------------- #
+# --- Serialization Plans ---------------------------------------------------------------------------------------- #
+# ---------------------------------------------------------------------------------------------------------------- #
+def _serializable_encoder(property_name: str, presence_name: Optional[str]) -> Callable[[Any, dict], None]:
+    """Specializes `GenericParsable.to_dict_serializable` for one attribute of a class."""
+    def encode(self, output: dict, _name=property_name, _presence=presence_name):
+        if _presence is not None and not getattr(self, _presence):
+            return
+        value = getattr(self, _name)
+        if hasattr(value, 'tolist'):
+            value = value.tolist()
+        if isinstance(value, frozenset):
+            value = _stable_list(value) if self._stable_serialization else list(value)
+        output[_name] = value
+    return encode
+
+
+def _enum_encoder(property_name: str, presence_name: Optional[str]) -> Callable[[Any, dict], None]:
+    """Specializes `GenericParsable.to_dict_enum` for one attribute of a class."""
+    def encode(self, output: dict, _name=property_name, _presence=presence_name):
+        if _presence is None or getattr(self, _presence):
+            output[_name] = getattr(self, _name).name
+    return encode
+
+
+def _parsable_encoder(property_name: str, presence_name: Optional[str]) -> Callable[[Any, dict], None]:
+    """Specializes `GenericParsable.to_dict_parsable` for one attribute of a class."""
+    def encode(self, output: dict, _name=property_name, _presence=presence_name):
+        if _presence is None or getattr(self, _presence):
+            output[_name] = getattr(self, _name).to_dict()
+    return encode
+
+
+def _dict_of_parsables_encoder(property_name: str, presence_name: Optional[str]) -> Callable[[Any, dict], None]:
+    """Specializes `GenericParsable.to_dict_dict_of_parsable` for one attribute of a class."""
+    def encode(self, output: dict, _name=property_name, _presence=presence_name):
+        if _presence is None or getattr(self, _presence):
+            item = getattr(self, _name)
+            if isinstance(item, dict):
+                output[_name] = GenericParsable.serialized_dict(item)
+    return encode
+
+
+def _list_of_parsables_encoder(property_name: str, presence_name: Optional[str]) -> Callable[[Any, dict], None]:
+    """Specializes `GenericParsable.to_dict_list_of_parsable` for one attribute of a class."""
+    def encode(self, output: dict, _name=property_name, _presence=presence_name):
+        if _presence is None or getattr(self, _presence):
+            item = getattr(self, _name)
+            item_type = type(item)
+            # --- lists and tuples are checked by type, avoiding the Sequence ABC instance check ---
+            if item_type is list or item_type is tuple:
+                output[_name] = GenericParsable.serialized_list(item)
+            elif isinstance(item, (set, frozenset)):
+                output[_name] = GenericParsable.serialized_list(_stable_list(item) if self._stable_serialization
+                                                                else item)
+            elif isinstance(item, Sequence):
+                output[_name] = GenericParsable.serialized_list(item)
+    return encode
+
+
+def _specialized_encoder(property_name: str, presence_name: Optional[str]) -> Callable[[Any, dict], None]:
+    """Specializes `GenericParsable.to_dict_specialized` for one attribute of a class."""
+    def encode(self, output: dict, _name=property_name, _presence=presence_name, _encoder_name=property_name + '_encode'):
+        encoder = getattr(self, _encoder_name, None)
+        if encoder is None:
+            loghandler.log_and_raise(AttributeError, "Unable to construct attribute [", _name,
+                                     "] since there is no function [", _encoder_name, "].")
+        if _presence is None or getattr(self, _presence):
+            output[_name] = encoder()
+    return encode
+
+
+# --- the to_dict helper of each attribute category, in the order in which to_dict serializes the categories ---
+_TO_DICT_CATEGORIES = (('to_dict_serializable', _serializable_encoder),
+                       ('to_dict_enum', _enum_encoder),
+                       ('to_dict_parsable', _parsable_encoder),
+                       ('to_dict_dict_of_parsable', _dict_of_parsables_encoder),
+                       ('to_dict_list_of_parsable', _list_of_parsables_encoder),
+                       ('to_dict_specialized', _specialized_encoder))
+
+
+@functools.lru_cache(maxsize=256)
+def _to_dict_plan(class_type: type, categories: Tuple[Tuple[str, ...], ...]) -> Tuple[Callable[[Any, dict], None], ...]:
+    """Builds the functions serializing the registered attributes of a class, in the order `to_dict` visits them.
+
+    Notes:
+        The plan is memoized per class and set of registered attribute names. Each attribute is served by a function
+        specialized to it, which has the name of its 'has_' property resolved in advance. A category whose to_dict
+        helper is overridden by the class calls that override instead. The version of a class keeping the version
+        properties of GenericParsable is read from its slot directly.
+
+    Args:
+        class_type: type
+            The GenericParsable subclass to serialize.
+        categories: Tuple[Tuple[str, ...], ...]
+            The registered attribute names of each category, in the order of `_TO_DICT_CATEGORIES`.
+
+    Returns:
+        Tuple[Callable[[Any, dict], None], ...]:
+            Functions which take the instance and the output dictionary and serialize one attribute each.
+    """
+    plan = []
+    for (helper_name, make_encoder), property_names in zip(_TO_DICT_CATEGORIES, categories):
+        helper = getattr(class_type, helper_name)
+        overridden = helper is not getattr(GenericParsable, helper_name)
+        for property_name in property_names:
+            if overridden:
+                plan.append(functools.partial(_call_to_dict_helper, helper, property_name))
+            elif make_encoder is _serializable_encoder and property_name == 'version' and \
+                    _reads_version_slot(class_type):
+                plan.append(_version_encoder)
+            else:
+                plan.append(make_encoder(property_name, _presence_name(class_type, property_name)))
+    return tuple(plan)
+
+
+def _reads_version_slot(class_type: type) -> bool:
+    """Returns whether the version of a class is served by the properties of GenericParsable backed by its slot."""
+    return class_type.version is GenericParsable.version and class_type.has_version is GenericParsable.has_version
+
+
+def _version_encoder(self, output: dict):
+    """Serializes the version by reading its slot, which spares the 'has_version' and 'version' properties."""
+    value = self._version
+    if value is not None:
+        output['version'] = value
+
+
+def _call_to_dict_helper(helper: Callable[[Any, dict, str], None], property_name: str, self, output: dict):
+    """Calls a to_dict helper overridden by a subclass for one attribute."""
+    helper(self, output, property_name)
+
+
+# ---------------------------------------------------------------------------------------------------------------- #
+# --- Dispatch Tables -------------------------------------------------------------------------------------------- #
+# ---------------------------------------------------------------------------------------------------------------- #
+# --- the handlers of the attribute categories, in the order in which from_dict and update look the categories up ---
+_FROM_DICT_HANDLERS = ('from_dict_serializable', 'from_dict_parsable', 'from_dict_enum', 'from_dict_dict_of_parsable',
+                       'from_dict_list_of_parsable', 'from_dict_specialized')
+_UPDATE_HANDLERS = ('update_serializable_property', 'update_parsable_property', 'update_enum_property',
+                    'update_dict_of_parsable_property', 'update_list_of_parsable_property',
+                    'update_specialized_property')
+# --- the handlers replacing those of the serializable category for the numeric attributes of a class ---
+_NUMERIC_HANDLERS = {_FROM_DICT_HANDLERS: 'from_dict_numeric', _UPDATE_HANDLERS: 'update_numeric_property'}
+# --- the positions of the dictionary and list of parsables categories, whose from_dict handlers can parse lazily ---
+_LAZY_CATEGORIES = frozenset((3, 4))
+# --- dispatch tables by class, handler names and registered attributes ---
+_dispatch_tables = dict()
+_DISPATCH_TABLE_CACHE_SIZE = 256
+
+
+def _dispatch_table(parsable: GenericParsable, handler_names: Tuple[str, ...]) -> Tuple[Tuple[str, Callable, int], ...]:
+    """Resolves the handler of every registered attribute of a GenericParsable, in the order of parsing.
+
+    Notes:
+        The table is memoized per class, handler names and registered attributes, so the category of each attribute
+        is looked up once rather than on every call. Registering another attribute changes the key of the table and
+        therefore builds a new one. Handlers overridden by the class are resolved from the class. Serializable
+        attributes named in `_numeric_serializable_attributes` are dispatched to the numeric handler instead.
+        The attribute names are interned, so that names registered from strings built at runtime are looked up in
+        the per-class caches and the input dictionaries by identity.
+
+    Args:
+        parsable: GenericParsable
+            The instance whose registered attributes are dispatched.
+        handler_names: Tuple[str, ...]
+            The names of the handlers of each category, in the order of `_FROM_DICT_HANDLERS`.
+
+    Returns:
+        Tuple[Tuple[str, Callable, int], ...]:
+            The name of each attribute, the function handling it and the position of its category.
+
+    Raises:
+        ValueError:
+            If there are attributes registered in the '_desired_order_of_parsing' property that are not
+            registered in any of the attributes categories.
+    """
+    class_type = type(parsable)
+    key = (class_type, handler_names, parsable.registration_key())
+    table = _dispatch_tables.get(key)
+    if table is None:
+        categories = (parsable._serializable_attributes, parsable._parsable_attributes, parsable._enum_attributes,
+                      parsable._dict_of_parsables, parsable._list_of_parsables, parsable._specialized_attributes)
+        handlers = tuple(getattr(class_type, name) for name in handler_names)
+        numeric_attributes = class_type._numeric_serializable_attributes
+        numeric_handler = getattr(class_type, _NUMERIC_HANDLERS[handler_names]) if numeric_attributes else None
+        ordered_attributes, unordered_attributes = parsable.split_ordered_and_unordered_attributes()
+        entries = []
+        for property_name in (*ordered_attributes, *unordered_attributes):
+            property_name = sys.intern(property_name)
+            for index, property_names in enumerate(categories):
+                if property_name in property_names:
+                    if index == 0 and property_name in numeric_attributes:
+                        entries.append((property_name, numeric_handler, index))
+                    else:
+                        entries.append((property_name, handlers[index], index))
+                    break
+            else:
+                loghandler.log_and_raise(RuntimeError, "The property [", property_name, "] doesn't exist!")
+        if len(_dispatch_tables) >= _DISPATCH_TABLE_CACHE_SIZE:
+            _dispatch_tables.clear()
+        table = _dispatch_tables[key] = tuple(entries)
+    return table
+
+
+# --- dispatchers generated by class, handler names and registered attributes ---
+_dispatchers = dict()
+
+
+def _stock_from_dict_handlers() -> Tuple[Callable, ...]:
+    """Returns the from_dict handlers of GenericParsable, which ignore attributes missing from their input."""
+    return tuple(getattr(GenericParsable, name) for name in (*_FROM_DICT_HANDLERS, 'from_dict_numeric'))
+
+
+def _compile_dispatcher(table: Tuple[Tuple[str, Callable, int], ...], arguments: str, lazy: bool) -> Callable:
+    """Generates a function calling the handler of every attribute of a dispatch table in straight-line code.
+
+    Notes:
+        The attribute names are inlined as constants, so a call performs no loop and no unpacking of the table.
+        Handlers of the lazy categories are passed `lazy=True` only when the generated function is called lazily.
+        Lazy functions are the from_dict dispatchers. The stock from_dict handlers of GenericParsable ignore attributes
+        missing from `input_value`, so those are only called for the attributes present, which spares a call per
+        missing attribute when deserializing partial dictionaries. Handlers overridden by a subclass are always called,
+        since they may act on missing attributes, for instance by setting a default. When every handler is a stock one,
+        an empty input returns before any of them is called.
+
+    Args:
+        table: Tuple[Tuple[str, Callable, int], ...]
+            The dispatch table returned by `_dispatch_table`.
+        arguments: str
+            The arguments passed to every handler between the instance and the attribute name.
+        lazy: bool
+            If True, the generated function takes a `lazy` argument forwarded to the handlers of the lazy categories.
+    """
+    namespace = dict()
+    lines = ["def dispatch(self, " + arguments + (", lazy):" if lazy else "):"), "    pass"]
+    stock_handlers = ()
+    if lazy:
+        stock_handlers = _stock_from_dict_handlers()
+        if all(handler in stock_handlers for _, handler, _ in table):
+            lines.append("    if not input_value:")
+            lines.append("        return")
+    for index, (property_name, handler, category) in enumerate(table):
+        namespace["handler_%d" % index] = handler
+        call = "handler_%d(self, %s, %r" % (index, arguments, property_name)
+        if lazy and category in _LAZY_CATEGORIES:
+            call = "%s, lazy=True) if lazy else %s)" % (call, call)
+        else:
+            call += ")"
+        if handler in stock_handlers:
+            lines.append("    if %r in input_value:" % property_name)
+            lines.append("        " + call)
+        else:
+            lines.append("    " + call)
+    exec(compile("\n".join(lines), "<dispatch of %d attributes>" % len(table), "exec"), namespace)
+    return namespace["dispatch"]
+
+
+def _dispatcher(parsable: GenericParsable, handler_names: Tuple[str, ...]) -> Callable:
+    """Returns the generated function dispatching the registered attributes of a GenericParsable to their handlers.
+
+    Notes:
+        The functions are memoized like the dispatch tables they are generated from. Those of `_FROM_DICT_HANDLERS`
+        take the input dictionary and `lazy`, the others the `only_if_missing` flag and the input dictionary.
+    """
+    key = (type(parsable), handler_names, parsable.registration_key())
+    dispatch = _dispatchers.get(key)
+    if dispatch is None:
+        table = _dispatch_table(parsable, handler_names)
+        if handler_names is _FROM_DICT_HANDLERS:
+            dispatch = _compile_dispatcher(table, "input_value", lazy=True)
+        else:
+            dispatch = _compile_dispatcher(table, "only_if_missing, input_value", lazy=False)
+        if len(_dispatchers) >= _DISPATCH_TABLE_CACHE_SIZE:
+            _dispatchers.clear()
+        _dispatchers[key] = dispatch
+    return dispatch
+
+
+# --- marks the threads of the to_dict pool, whose nested to_dict calls must not wait on the pool themselves ---
+_to_dict_worker = threading.local()
+
+
+@functools.lru_cache(maxsize=1)
+def _to_dict_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """Returns the thread pool shared by the parallel to_dict calls, created on first use."""
+    return concurrent.futures.ThreadPoolExecutor(max_workers=os.cpu_count(), thread_name_prefix="to_dict")
+
+
+def _encode_in_worker(encode: Callable[[Any, dict], None], self) -> dict:
+    """Serializes one attribute from a thread of the to_dict pool into a dictionary of its own."""
+    _to_dict_worker.active = True
+    output = dict()
+    encode(self, output)
+    return output
+
 
+def _encode_in_parallel(self, plan: Tuple[Callable[[Any, dict], None], ...], output: dict):
+    """Serializes the attributes of a plan on the to_dict pool, merging the results in the order of the plan."""
+    futures = [_to_dict_executor().submit(_encode_in_worker, encode, self) for encode in plan]
+    for future in futures:
+        output.update(future.result())
 
-class Parsable(metaclass=ABCMeta):
+
+class Parsable:
     """
     A generic base class that enables serializing and deserializing internal information of subclasses.
 
-    Inherits:
-        abc.ABCMeta
+    Notes:
+        Subclasses must implement every method listed in `_REQUIRED_IMPLEMENTATIONS`, which is validated once when the
+        subclass is defined rather than on every instantiation. A subclass that leaves some of them to its own
+        subclasses is declared with `class Foo(Parsable, abstract=True)`.
     """
+    __slots__ = ()
+
+    _REQUIRED_IMPLEMENTATIONS = ('has_version', 'version', 'to_dict', 'from_dict', 'update', 'equals')
+
+    def __init_subclass__(cls, abstract: bool = False, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # --- the class identity written by to_dict, interned once per class ---
+        cls._parsable_type_name = sys.intern(cls.__name__)
+        cls._parsable_module_name = sys.intern(cls.__module__)
+        if abstract:
+            return
+        missing = [name for name in Parsable._REQUIRED_IMPLEMENTATIONS
+                   if getattr(cls, name, None) is getattr(Parsable, name)]
+        if missing:
+            loghandler.log_and_raise(TypeError, "The class [", cls.__name__, "] does not implement ", missing, ".")
+        properties.register_class(cls)
 
     def __init__(self, *args, **kwargs):
         pass
@@ -23,13 +423,11 @@ class Parsable(metaclass=ABCMeta):
     # --- Version Properties ----------------------------------------------------------------------------------------- #
     # ---------------------------------------------------------------------------------------------------------------- #
     @property
-    @abstractmethod
     def has_version(self) -> bool:
         """Returns whether the version has been assigned."""
-        pass  # pragma: no cover
+        raise NotImplementedError  # pragma: no cover
 
     @property
-    @abstractmethod
     def version(self) -> str:
         """Gets the version of this implementation of the Parsable class.
 
@@ -45,10 +443,9 @@ class Parsable(metaclass=ABCMeta):
             AttributeError:
                 If the property has not been assigned yet.
         """
-        pass  # pragma: no cover
+        raise NotImplementedError  # pragma: no cover
 
     @version.setter
-    @abstractmethod
     def version(self, input_value: Optional[str]):
         """Sets the version of this implementation of the Parsable class.
 
@@ -60,12 +457,11 @@ class Parsable(metaclass=ABCMeta):
             TypeError:
                 If the provided `input_value` is not a supported type.
         """
-        pass  # pragma: no cover
+        raise NotImplementedError  # pragma: no cover
 
     # ---------------------------------------------------------------------------------------------------------------- #
     # --- Conversions ------------------------------------------------------------------------------------------------ #
     # ---------------------------------------------------------------------------------------------------------------- #
-    @abstractmethod
     def to_dict(self) -> dict:
         """Serializes internal attributes into a JSON-compatible dictionary.
 
@@ -74,9 +470,8 @@ class Parsable(metaclass=ABCMeta):
                 A dictionary holding serializable keys that map to serialized representations of the values of
                 internal attributes.
         """
-        pass  # pragma: no cover
+        raise NotImplementedError  # pragma: no cover
 
-    @abstractmethod
     def from_dict(self, input_value: dict):
         """Populates the internal attributes from an input dictionary of serialized representation of values.
 
@@ -85,9 +480,21 @@ class Parsable(metaclass=ABCMeta):
                 The serialized dictionary that is to be deserialized and used to hydrate the internal structures of this
                 subclass implementation.
         """
-        pass  # pragma: no cover
+        raise NotImplementedError  # pragma: no cover
+
+    def from_dict_items(self, items: Iterable[Tuple[str, Any]]):
+        """Populates the internal attributes from the key and value pairs of a serialized representation.
+
+        Notes:
+            The pairs are collected into a dictionary that is passed to `from_dict`. Subclasses may populate the
+            attributes as the pairs arrive instead.
+
+        Args:
+            items: Iterable[Tuple[str, Any]]
+                The key and value pairs of the serialized dictionary.
+        """
+        self.from_dict(dict(items))
 
-    @abstractmethod
     def update(self, only_if_missing: bool, input_value: dict):
         """Updates the internal attributes from the dictionary of the serialized representation of their values.
 
@@ -103,9 +510,8 @@ class Parsable(metaclass=ABCMeta):
                 The serialized dictionary that is to be deserialized and used to hydrate the internal structures of this
                 subclass implementation.
         """
-        pass  # pragma: no cover
+        raise NotImplementedError  # pragma: no cover
 
-    @abstractmethod
     def equals(self, other: Parsable, **kwargs) -> bool:
         """Compares whether two Parsable objects are equal in their parsable attributes.
 
@@ -119,7 +525,7 @@ class Parsable(metaclass=ABCMeta):
             bool:
                 True iff all parsable attributes are equal.
         """
-        pass  # pragma: no cover
+        raise NotImplementedError  # pragma: no cover
 
     # ---------------------------------------------------------------------------------------------------------------- #
     # --- Serialization and IO --------------------------------------------------------------------------------------- #
@@ -143,6 +549,28 @@ class Parsable(metaclass=ABCMeta):
             return self.to_dict()
         return io.to_pickled_json(self)
 
+    def to_json_bytes(self, pickled: bool, sort_keys: bool = False) -> bytes:
+        """Returns the UTF-8 encoded JSON document of either the serialized attributes or the pickled class.
+
+        Notes:
+            The document is produced as bytes by orjson when it is installed, so callers writing it to a socket or
+            an HTTP response do not need to encode a string first.
+
+        Args:
+            pickled: bool
+                If True then the entire class will be pickled into a JSON schema representation of this class. If false
+                then the internal serialization routine will be performed.
+            sort_keys: bool
+                If True, the keys of the serialized attributes are sorted. Ignored if `pickled` is True.
+
+        Returns:
+            bytes
+                The encoded JSON document.
+        """
+        if pickled:
+            return io.to_pickled_json_bytes(self)
+        return io.to_json_bytes(self.to_dict(), sort_keys=sort_keys)
+
     def from_json(self, json_object: Union[dict, str]):
         """Populates the internal attributes from a JSON based representation.
 
@@ -179,7 +607,10 @@ class Parsable(metaclass=ABCMeta):
                 Indicates whether the entire class should be pickled. If False, then only the internal serialized
                 attributes from this Parsable will be saved.
             **kwargs:
-                Additional key-word arguments to provide to the JSON writer.
+                Additional key-word arguments to provide to the JSON writer. The output is written by orjson when it
+                is installed and the arguments are limited to `indent=2` and `sort_keys`; any other argument, such as
+                a different indent or `ensure_ascii=True`, falls back to the slower standard library encoder. The
+                two encoders format the document differently, as described in `io.to_json_str`.
 
         Returns:
             Path
@@ -229,6 +660,29 @@ class Parsable(metaclass=ABCMeta):
         # --- create the python object ---
         self.from_json(json_object)
 
+    def load_from_json_streaming(self, file_path: Union[Path, str]):
+        """Loads and populates the internal attributes of this subclass from a JSON file parsed incrementally.
+
+        Notes:
+            The top level attributes are read one at a time by `io.iter_json_items` and handed to `from_dict_items`,
+            which populates the attributes of a GenericParsable as they arrive. With ijson installed, only one top
+            level value is then held in memory at a time. Use `load_from_json` for documents the incremental parser
+            does not accept, such as ones holding NaN values.
+
+        Args:
+            file_path: Union[Path, str]
+                The full path of the JSON file that is to be loaded.
+
+        Raises:
+            RuntimeError: If the provided 'file_path' does not point to file that currently exists.
+        """
+        # --- validate the file path ---
+        if not io.file_exists(file_path):
+            loghandler.log_and_raise(RuntimeError,"The file path [", file_path, "] does not exist. Cannot load object.")
+
+        # --- create the python object ---
+        self.from_dict_items(io.iter_json_items(file_path))
+
     @classmethod
     def load_from_pickled_json(cls, file_path, **kwargs):
         """Loads a pickled JSON representation of a python class from file.
@@ -302,7 +756,36 @@ class Parsable(metaclass=ABCMeta):
 
 
 class GenericParsable(Parsable):
-    """A class for generically parsing attributes of its eventual child class implementations."""
+    """A class for generically parsing attributes of its eventual child class implementations.
+
+    Notes:
+        The registered attributes and the version are stored in `__slots__`. Subclasses should declare the private
+        attributes backing their properties in their own `__slots__`, otherwise their instances also carry a
+        `__dict__`. Once a subclass has registered all of its attributes, `freeze_registration` can compact the
+        registration lists of an instance into tuples.
+
+        A subclass setting `_releases_gil = True` has its attributes serialized on a shared thread pool by `to_dict`
+        once it registers more than `_parallel_to_dict_threshold` of them. This only pays off when serializing the
+        attributes releases the GIL, as pure Python serializers merely take turns on it.
+
+        Sets are serialized as lists sorted by their items, so that equal objects always produce the same document,
+        unless their items cannot be compared. Subclasses can set `_stable_serialization = False` to skip the sort.
+
+        Subclasses can map serializable attributes holding numeric sequences to a numpy dtype in
+        `_numeric_serializable_attributes`. Their serialized lists are then converted to arrays of that dtype in a
+        single call by `from_dict` and `update`, and their arrays are serialized back to lists by `to_dict`.
+    """
+    __slots__ = ('_serializable_attributes', '_enum_attributes', '_parsable_attributes', '_specialized_attributes',
+                 '_dict_of_parsables', '_list_of_parsables', '_desired_order_of_parsing', '_version',
+                 '_frozen_registration_key')
+
+    # --- subclasses whose attributes serialize while releasing the GIL may opt into a parallel to_dict ---
+    _releases_gil = False
+    _parallel_to_dict_threshold = 16
+    # --- sets are serialized in sorted order, which subclasses holding very large sets may switch off ---
+    _stable_serialization = True
+    # --- serializable attributes deserialized as numpy arrays, by name and dtype ---
+    _numeric_serializable_attributes = types.MappingProxyType({})
 
     def __init__(self, *args, **kwargs):
         super().__init__()
@@ -316,6 +799,7 @@ class GenericParsable(Parsable):
 
         # --- order of parsing ---
         self._desired_order_of_parsing = []
+        self._frozen_registration_key = None
 
         # --- update the parsable attributes ---
         self._serializable_attributes.extend(['version'])
@@ -328,21 +812,101 @@ class GenericParsable(Parsable):
     # ---------------------------------------------------------------------------------------------------------------- #
     @property
     def has_version(self) -> bool:
+        """Returns whether the version has been assigned."""
         return self._version is not None
 
     @property
     def version(self) -> str:
-        if self._version is None:
+        """Gets the version of this implementation of the Parsable class.
+
+        Notes:
+            The version should be incremented for every interface change made to an implementation of the
+            Parsable class. This will allow tracking of parameter evolution with evolving data.
+
+        Returns:
+            str:
+                The version number as a string.
+
+        Raises:
+            AttributeError:
+                If the property has not been assigned yet.
+        """
+        value = self._version
+        if value is None:
             loghandler.log_and_raise(AttributeError, "The version parameter has not been set.")
-        return self._version
+        return value
 
     @version.setter
-    def version(self, input_value: Optional[bool]):
+    def version(self, input_value: Optional[str]):
+        """Sets the version of this implementation of the Parsable class.
+
+        Args:
+            input_value: Optional[str]
+                None or a string representation of the version.
+
+        Raises:
+            TypeError:
+                If the provided `input_value` is not a supported type.
+        """
         if input_value is None or isinstance(input_value, str):
             self._version = input_value
         else:
             loghandler.log_and_raise(TypeError, "Invalid input type [", type(input_value), "].")
 
+    def __getstate__(self) -> dict:
+        """Returns the values of the slots and of the instance dictionary by their attribute names.
+
+        Notes:
+            The default state of an object with both slots and an instance dictionary is a tuple, of which jsonpickle
+            only restores the dictionary, which loses the registered attributes held in the slots.
+        """
+        class_type = type(self)
+        state = dict(getattr(self, '__dict__', None) or ())
+        for descriptor in slot_descriptors(class_type):
+            try:
+                state[descriptor.__name__] = descriptor.__get__(self, class_type)
+            except AttributeError:
+                continue
+        return state
+
+    def __setstate__(self, state: dict):
+        """Restores the values of the slots and of the instance dictionary returned by `__getstate__`."""
+        self._frozen_registration_key = None
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
+    # ---------------------------------------------------------------------------------------------------------------- #
+    # --- Registration ----------------------------------------------------------------------------------------------- #
+    # ---------------------------------------------------------------------------------------------------------------- #
+    def freeze_registration(self):
+        """Converts the registered attribute categories and the parsing order into tuples.
+
+        Notes:
+            Tuples are allocated at their exact size, which saves the spare capacity lists keep for growth, and are
+            iterated slightly faster by the serialization routines. Attributes can no longer be registered on this
+            instance afterwards, so this should only be called at the end of the `__init__` of the final subclass.
+            The registration key is computed once as well, which spares `from_dict` and `update` from collecting the
+            registered attributes on every call.
+        """
+        self._serializable_attributes = tuple(self._serializable_attributes)
+        self._enum_attributes = tuple(self._enum_attributes)
+        self._parsable_attributes = tuple(self._parsable_attributes)
+        self._specialized_attributes = tuple(self._specialized_attributes)
+        self._dict_of_parsables = tuple(self._dict_of_parsables)
+        self._list_of_parsables = tuple(self._list_of_parsables)
+        self._desired_order_of_parsing = tuple(self._desired_order_of_parsing)
+        self._frozen_registration_key = None
+        self._frozen_registration_key = self.registration_key()
+
+    def registration_key(self) -> Tuple[Tuple[str, ...], ...]:
+        """Returns the registered attributes of each category and the parsing order as a hashable tuple of tuples."""
+        key = self._frozen_registration_key
+        if key is not None:
+            return key
+        return (tuple(self._serializable_attributes), tuple(self._enum_attributes), tuple(self._parsable_attributes),
+                tuple(self._dict_of_parsables), tuple(self._list_of_parsables), tuple(self._specialized_attributes),
+                tuple(self._desired_order_of_parsing))
+
     # ---------------------------------------------------------------------------------------------------------------- #
     # --- Parsing Order ---------------------------------------------------------------------------------------------- #
     # ---------------------------------------------------------------------------------------------------------------- #
@@ -370,26 +934,26 @@ class GenericParsable(Parsable):
                 registered in any of the attributes categories.
         """
         # --- collect the attributes ---
-        ordered_attributes = np.asanyarray(self._desired_order_of_parsing)
-        all_attributes = np.asanyarray(self.collect_all_attributes())
+        ordered_attributes = list(self._desired_order_of_parsing)
+        all_attributes = self.collect_all_attributes()
 
         # --- trivial case ---
-        if ordered_attributes.size == 0:
-            return [], all_attributes.tolist()
+        if not ordered_attributes:
+            return [], all_attributes
 
         # --- ensure that all ordered attributes exist in the list of attributes ---
-        exist = np.in1d(ordered_attributes, all_attributes)
-        if not np.all(exist):
-            missing_attributes = ordered_attributes[np.argwhere(np.logical_not(exist))]
+        registered_attributes = set(all_attributes)
+        missing_attributes = [x for x in ordered_attributes if x not in registered_attributes]
+        if missing_attributes:
             loghandler.log_and_raise(ValueError, "The desired ordered attributes [", missing_attributes,
                                  "] are missing from the registered attributes for class [",
                                  self.__class__.__name__, "].")
 
         # --- get the attributes that are not in the list of ordered attributes ---
-        unordered_attributes = all_attributes[np.argwhere(np.logical_not(np.in1d(all_attributes, ordered_attributes)))]
-        unordered_attributes = unordered_attributes.ravel()
+        ordered_set = set(ordered_attributes)
+        unordered_attributes = [x for x in all_attributes if x not in ordered_set]
         # --- return the ordered attributes and the unordered attributes ---
-        return ordered_attributes.tolist(), unordered_attributes.tolist()
+        return ordered_attributes, unordered_attributes
 
     # ---------------------------------------------------------------------------------------------------------------- #
     # --- Conversions ------------------------------------------------------------------------------------------------ #
@@ -402,47 +966,32 @@ class GenericParsable(Parsable):
             input_value: dict
                 A dictionary of serializable keys mapping to objects that contain either a 'to_dict()' or 'tolist()'
                 method. Values which do not contain one of these two methods are placed into the output dictionary
-                as is.
+                as is. The method to use is resolved once per type of value.
 
         Returns:
             dict
                 The serialized representation of the 'input_value'.
         """
-        parsed_items = dict()
-        for key, value in input_value.items():
-            if hasattr(value, 'to_dict'):
-                parsed_items[key] = value.to_dict()
-            elif hasattr(value, 'tolist'):
-                parsed_items[key] = value.tolist()
-            else:
-                parsed_items[key] = value
-        return parsed_items
+        return {key: _serialized_value(value) for key, value in input_value.items()}
 
     @staticmethod
-    def serialized_list(input_value: list) -> list:
+    def serialized_list(input_value: Iterable) -> list:
         """Converts a list of serializable and parsable values into their serialized representation.
 
         Args:
-            input_value: list
-                A list of objects that contain either a 'to_dict()' or 'tolist()' method. Objects which do not contain
-                one of these two methods are placed into the output list as is.
+            input_value: Iterable
+                A list, or any other iterable, of objects that contain either a 'to_dict()' or 'tolist()' method.
+                Objects which do not contain one of these two methods are placed into the output list as is. The
+                output list is the only list that is built.
 
         Returns:
             list
                 The serialized representation of the 'input_value'.
         """
-        parsed_items = list()
-        for item in input_value:
-            if hasattr(item, 'to_dict'):
-                parsed_items.append(item.to_dict())
-            elif hasattr(item, 'tolist'):
-                parsed_items.append(item.tolist())
-            else:
-                parsed_items.append(item)
-        return parsed_items
+        return [_serialized_value(item) for item in input_value]
 
     @staticmethod
-    def parsed_dict(input_value: dict) -> dict:
+    def parsed_dict(input_value: dict, lazy: bool = False) -> dict:
         """Converts a dictionary of serializable and parsable values from their serialized representation.
 
         Args:
@@ -450,24 +999,18 @@ class GenericParsable(Parsable):
                 A dictionary of serialized keys mapping to the serialized dictionary representation of Parsable
                 subclasses. Vales that are not dictionaries or do not contain the key defined at
                 'package.utilities.properties.generic_parsable_type' are placed into the output dictionary as is.
+            lazy: bool
+                If True, the Parsable values are returned as LazyParsable stand-ins that are only constructed once
+                they are used.
 
         Returns:
             dict
                 The deserialized representation of the 'input_value'.
         """
-        parsed_items = dict()
-        for key, value in input_value.items():
-            if isinstance(value, dict):
-                if properties.generic_parsable_type in value:
-                    parsed_items[key] = properties.ParsableProperty.parse(value, throw_if_unable_to_parse=True)
-                else:
-                    parsed_items[key] = value
-            else:
-                parsed_items[key] = value
-        return parsed_items
+        return {key: _parsed_value(value, lazy) for key, value in input_value.items()}
 
     @staticmethod
-    def parsed_list(input_value: list) -> list:
+    def parsed_list(input_value: list, lazy: bool = False) -> list:
         """Converts a list of serializable and parsable values from their serialized representation.
 
         Args:
@@ -475,21 +1018,34 @@ class GenericParsable(Parsable):
                 A list of serialized dictionary representation of Parsable subclasses. Objects that are not dictionaries
                 or do not contain the key defined at 'package.utilities.properties.generic_parsable_type' are placed into
                 the output list as is.
+            lazy: bool
+                If True, the Parsable items are returned as LazyParsable stand-ins that are only constructed once
+                they are used.
 
         Returns:
             list
                 The deserialized representation of the 'input_value'.
         """
-        parsed_items = list()
-        for item in input_value:
-            if isinstance(item, dict):
-                if properties.generic_parsable_type in item:
-                    parsed_items.append(properties.ParsableProperty.parse(item, throw_if_unable_to_parse=True))
-                else:
-                    parsed_items.append(item)
-            else:
-                parsed_items.append(item)
-        return parsed_items
+        return [_parsed_value(item, lazy) for item in input_value]
+
+    def _is_present(self, property_name: str) -> bool:
+        """Returns the value of the 'has_' property of an attribute, or True if the class does not define one."""
+        presence_name = _presence_name(type(self), property_name)
+        return presence_name is None or getattr(self, presence_name)
+
+    def _get_if_present(self, property_name: str) -> Tuple[bool, Any]:
+        """Returns whether an attribute is assigned and, if it is, its value.
+
+        Notes:
+            An attribute without a 'has_' property on the class is always considered assigned.
+
+        Returns:
+            Tuple[bool, Any]:
+                Whether the attribute is assigned and its value, which is None if it is not assigned.
+        """
+        if self._is_present(property_name):
+            return True, getattr(self, property_name)
+        return False, None
 
     def to_dict_serializable(self, output: dict, property_name: str):
         """Retrieves the serializable attribute and populates the output dictionary with its serialized representation.
@@ -500,20 +1056,12 @@ class GenericParsable(Parsable):
             property_name: str
                 The name of the serializable attribute to retrieve from this GenericParsable subclass.
         """
-        if hasattr(self, "has_" + property_name):
-            if self.__getattribute__("has_" + property_name):
-                value = self.__getattribute__(property_name)
-                if hasattr(value, 'tolist'):
-                    value = value.tolist()
-                if isinstance(value, frozenset):
-                    value = list(value)
-                output[property_name] = value
-        else:
-            value = self.__getattribute__(property_name)
+        present, value = self._get_if_present(property_name)
+        if present:
             if hasattr(value, 'tolist'):
                 value = value.tolist()
             if isinstance(value, frozenset):
-                value = list(value)
+                value = _stable_list(value) if self._stable_serialization else list(value)
             output[property_name] = value
 
     def to_dict_enum(self, output: dict, property_name: str):
@@ -525,11 +1073,9 @@ class GenericParsable(Parsable):
             property_name: str
                 The name of the enum attribute to retrieve from this GenericParsable subclass.
         """
-        if hasattr(self, "has_" + property_name):
-            if self.__getattribute__("has_" + property_name):
-                output[property_name] = self.__getattribute__(property_name).name
-        else:
-            output[property_name] = self.__getattribute__(property_name).name
+        present, value = self._get_if_present(property_name)
+        if present:
+            output[property_name] = value.name
 
     def to_dict_parsable(self, output: dict, property_name: str):
         """Retrieves the Parsable attribute and populates the output dictionary with its serialized representation.
@@ -540,11 +1086,9 @@ class GenericParsable(Parsable):
             property_name: str
                 The name of the Parsable attribute to retrieve from this GenericParsable subclass.
         """
-        if hasattr(self, "has_" + property_name):
-            if self.__getattribute__("has_" + property_name):
-                output[property_name] = self.__getattribute__(property_name).to_dict()
-        else:
-            output[property_name] = self.__getattribute__(property_name).to_dict()
+        present, value = self._get_if_present(property_name)
+        if present:
+            output[property_name] = value.to_dict()
 
     def to_dict_dict_of_parsable(self, output: dict, property_name: str):
         """
@@ -558,15 +1102,9 @@ class GenericParsable(Parsable):
                 The name of the attribute whose value is a dictionary of Parsable objects to retrieve from this
                 GenericParsable subclass.
         """
-        if hasattr(self, "has_" + property_name):
-            if self.__getattribute__("has_" + property_name):
-                item = self.__getattribute__(property_name)
-                if isinstance(item, dict):
-                    output[property_name] = GenericParsable.serialized_dict(item)
-        else:
-            item = self.__getattribute__(property_name)
-            if isinstance(item, dict):
-                output[property_name] = GenericParsable.serialized_dict(item)
+        present, item = self._get_if_present(property_name)
+        if present and isinstance(item, dict):
+            output[property_name] = GenericParsable.serialized_dict(item)
 
     def to_dict_list_of_parsable(self, output: dict, property_name: str):
         """
@@ -580,16 +1118,18 @@ class GenericParsable(Parsable):
                 The name of the attribute whose value is a list of Parsable objects to retrieve from this
                 GenericParsable subclass.
         """
-        if hasattr(self, "has_" + property_name):
-            if self.__getattribute__("has_" + property_name):
-                item = self.__getattribute__(property_name)
-                if isinstance(item, (Sequence, set, frozenset)):
-                    output[property_name] = GenericParsable.serialized_list(list(item))
-
-        else:
-            item = self.__getattribute__(property_name)
-            if isinstance(item, (Sequence, set, frozenset)):
-                output[property_name] = GenericParsable.serialized_list(list(item))
+        present, item = self._get_if_present(property_name)
+        if not present:
+            return
+        item_type = type(item)
+        # --- lists and tuples are checked by type, avoiding the Sequence ABC instance check ---
+        if item_type is list or item_type is tuple:
+            output[property_name] = GenericParsable.serialized_list(item)
+        elif isinstance(item, (set, frozenset)):
+            output[property_name] = GenericParsable.serialized_list(_stable_list(item) if self._stable_serialization
+                                                                    else item)
+        elif isinstance(item, Sequence):
+            output[property_name] = GenericParsable.serialized_list(item)
 
     def to_dict_specialized(self, output: dict, property_name: str):
         """
@@ -607,44 +1147,32 @@ class GenericParsable(Parsable):
         Raises:
             AttributeError: If the GenericParsable subclass does not have a method named ''property_name'_encode'.
         """
-        if hasattr(self, property_name + '_encode'):
-            if hasattr(self, "has_" + property_name):
-                if self.__getattribute__("has_" + property_name):
-                    output[property_name] = self.__getattribute__(property_name + '_encode')()
-            else:
-                output[property_name] = self.__getattribute__(property_name + '_encode')()
+        encoder_name = property_name + '_encode'
+        encoder = getattr(self, encoder_name, None)
+        if encoder is not None:
+            if self._is_present(property_name):
+                output[property_name] = encoder()
         else:
             loghandler.log_and_raise(AttributeError, "Unable to construct attribute [", property_name,
-                                 "] since there is no function [", property_name + '_encode', "].")
+                                 "] since there is no function [", encoder_name, "].")
 
     def to_dict(self) -> dict:
-        output = dict()
-        output[properties.generic_parsable_type] = self.__class__.__name__
-        output[properties.generic_parsable_module] = self.__class__.__module__
-
-        # --- serializable ---
-        for property_name in self._serializable_attributes:
-            self.to_dict_serializable(output, property_name)
-
-        # --- enums ---
-        for property_name in self._enum_attributes:
-            self.to_dict_enum(output, property_name)
-
-        # --- parsable ---
-        for property_name in self._parsable_attributes:
-            self.to_dict_parsable(output, property_name)
-
-        # --- dict of parsables ---
-        for property_name in self._dict_of_parsables:
-            self.to_dict_dict_of_parsable(output, property_name)
-
-        # --- list of parsables ---
-        for property_name in self._list_of_parsables:
-            self.to_dict_list_of_parsable(output, property_name)
-
-        # --- specialized ---
-        for property_name in self._specialized_attributes:
-            self.to_dict_specialized(output, property_name)
+        output = {properties.generic_parsable_type: self._parsable_type_name,
+                  properties.generic_parsable_module: self._parsable_module_name}
+
+        # --- serializable, enums, parsable, dict of parsables, list of parsables and specialized, in this order ---
+        plan = _to_dict_plan(type(self), (tuple(self._serializable_attributes),
+                                          tuple(self._enum_attributes),
+                                          tuple(self._parsable_attributes),
+                                          tuple(self._dict_of_parsables),
+                                          tuple(self._list_of_parsables),
+                                          tuple(self._specialized_attributes)))
+        if self._releases_gil and len(plan) > self._parallel_to_dict_threshold and \
+                not getattr(_to_dict_worker, 'active', False):
+            _encode_in_parallel(self, plan, output)
+        else:
+            for encode in plan:
+                encode(self, output)
         return output
 
     # ---------------------------------------------------------------------------------------------------------------- #
@@ -660,9 +1188,26 @@ class GenericParsable(Parsable):
                 The name of the serializable attribute to populate. This attribute is only populated if the
                 'property_name' is settable and is in the 'input_value'.
         """
-        if property_name in input_value:
-            if properties.can_set(self, property_name):
-                self.__setattr__(property_name, input_value.get(property_name))
+        value = input_value.get(property_name, _MISSING)
+        if value is not _MISSING and properties.can_set(self, property_name):
+            setattr(self, property_name, value)
+
+    def from_dict_numeric(self, input_value: dict, property_name: str):
+        """Retrieves a numeric sequence from the input dictionary and populates the attribute with an array of it.
+
+        Args:
+            input_value: dict
+                The input dictionary of serialized attributes in which to deserialize.
+            property_name: str
+                The name of the numeric attribute to populate, which must be registered as serializable and named in
+                `_numeric_serializable_attributes`. This attribute is only populated if the 'property_name' is
+                settable and is in the 'input_value'. Values other than lists are assigned as they are.
+        """
+        value = input_value.get(property_name, _MISSING)
+        if value is not _MISSING and properties.can_set(self, property_name):
+            if isinstance(value, list):
+                value = np.asarray(value, dtype=self._numeric_serializable_attributes[property_name])
+            setattr(self, property_name, value)
 
     def from_dict_enum(self, input_value: dict, property_name: str):
         """Retrieves the enum value from the input dictionary and populates the desired attribute.
@@ -690,7 +1235,7 @@ class GenericParsable(Parsable):
         """
         self.from_dict_serializable(input_value, property_name)
 
-    def from_dict_dict_of_parsable(self, input_value: dict, property_name: str):
+    def from_dict_dict_of_parsable(self, input_value: dict, property_name: str, lazy: bool = False):
         """
         Retrieves the attribute whose value is a dictionary of Parsable objects from the input dictionary and
         populates the desired attribute.
@@ -701,15 +1246,16 @@ class GenericParsable(Parsable):
             property_name: str
                 The name of the attribute whose value is a dictionary of Parsable objects to populate. This
                 attribute is only populated if the 'property_name' is settable and is in the 'input_value'.
+            lazy: bool
+                If True, the Parsable values are populated as LazyParsable stand-ins.
         """
-        if property_name in input_value:
-            if properties.can_set(self, property_name):
-                value = input_value.get(property_name)
-                if isinstance(value, dict):
-                    value = GenericParsable.parsed_dict(value)
-                self.__setattr__(property_name, value)
+        value = input_value.get(property_name, _MISSING)
+        if value is not _MISSING and properties.can_set(self, property_name):
+            if isinstance(value, dict):
+                value = _parsed_dict(value, lazy)
+            setattr(self, property_name, value)
 
-    def from_dict_list_of_parsable(self, input_value: dict, property_name: str):
+    def from_dict_list_of_parsable(self, input_value: dict, property_name: str, lazy: bool = False):
         """
         Retrieves the attribute whose value is a list of Parsable objects from the input dictionary and
         populates the desired attribute.
@@ -720,13 +1266,14 @@ class GenericParsable(Parsable):
             property_name: str
                 The name of the attribute whose value is a list of Parsable objects to populate. This
                 attribute is only populated if the 'property_name' is settable and is in the 'input_value'.
+            lazy: bool
+                If True, the Parsable items are populated as LazyParsable stand-ins.
         """
-        if property_name in input_value:
-            if properties.can_set(self, property_name):
-                value = input_value.get(property_name)
-                if isinstance(value, list):
-                    value = GenericParsable.parsed_list(value)
-                self.__setattr__(property_name, value)
+        value = input_value.get(property_name, _MISSING)
+        if value is not _MISSING and properties.can_set(self, property_name):
+            if isinstance(value, list):
+                value = _parsed_list(value, lazy)
+            setattr(self, property_name, value)
 
     def from_dict_specialized(self, input_value: dict, property_name: str):
         """
@@ -744,30 +1291,76 @@ class GenericParsable(Parsable):
         Raises:
             AttributeError: If the GenericParsable subclass does not have a method named ''property_name'_decode'.
         """
-        if property_name in input_value:
-            if hasattr(self, property_name + '_decode'):
-                self.__getattribute__(property_name + '_decode')(input_value.get(property_name))
+        value = input_value.get(property_name, _MISSING)
+        if value is not _MISSING:
+            decoder_name = _decoder_name(type(self), property_name)
+            if decoder_name is not None:
+                getattr(self, decoder_name)(value)
             else:
                 loghandler.log_and_raise(AttributeError, "Unable to decode attribute [", property_name,
                                      "] since there is no function [", property_name + '_decode', "].")
 
-    def from_dict(self, input_value: dict):
-        ordered_attributes, unordered_attributes = self.split_ordered_and_unordered_attributes()
-        for property_name in (*ordered_attributes, *unordered_attributes):
-            if property_name in self._serializable_attributes:
-                self.from_dict_serializable(input_value, property_name)
-            elif property_name in self._parsable_attributes:
-                self.from_dict_parsable(input_value, property_name)
-            elif property_name in self._enum_attributes:
-                self.from_dict_enum(input_value, property_name)
-            elif property_name in self._dict_of_parsables:
-                self.from_dict_dict_of_parsable(input_value, property_name)
-            elif property_name in self._list_of_parsables:
-                self.from_dict_list_of_parsable(input_value, property_name)
-            elif property_name in self._specialized_attributes:
-                self.from_dict_specialized(input_value, property_name)
-            else:
-                loghandler.log_and_raise(RuntimeError, "The property [", property_name, "] doesn't exist!")
+    def from_dict(self, input_value: dict, lazy: bool = False):
+        """Populates the registered attributes from their serialized representation.
+
+        Args:
+            input_value: dict
+                The serialized dictionary that is to be deserialized.
+            lazy: bool
+                If True, the Parsable objects held in dictionaries and lists of parsables are populated as LazyParsable
+                stand-ins which are only constructed once they are used. Their setters must then accept the stand-ins,
+                which pass `isinstance` checks against the Parsable class.
+        """
+        _dispatcher(self, _FROM_DICT_HANDLERS)(self, input_value, lazy)
+
+    def from_dict_items(self, items: Iterable[Tuple[str, Any]]):
+        """Populates the registered attributes from the key and value pairs of their serialized representation.
+
+        Notes:
+            Each attribute is handed to its from_dict handler as soon as its pair arrives, so the pairs already
+            handled can be freed before the next one is read. Unordered attributes are populated in the order of
+            the pairs. Attributes named in '_desired_order_of_parsing' keep their order: the pairs arriving before
+            every one of them has been handled are held back until then, or until the last pair if one is missing.
+            Handlers overridden by a subclass are called with an empty input for the attributes that never arrive,
+            after all pairs were handled. Keys that are not registered attributes are ignored.
+
+        Args:
+            items: Iterable[Tuple[str, Any]]
+                The key and value pairs of the serialized dictionary.
+        """
+        table = _dispatch_table(self, _FROM_DICT_HANDLERS)
+        handlers = {property_name: handler for property_name, handler, _ in table}
+        ordered_attributes, _ = self.split_ordered_and_unordered_attributes()
+        position = 0
+        held = dict()
+        handled = set()
+        for property_name, value in items:
+            handler = handlers.get(property_name)
+            if handler is None:
+                continue
+            handled.add(property_name)
+            if position == len(ordered_attributes):
+                handler(self, {property_name: value}, property_name)
+                continue
+            held[property_name] = value
+            while position < len(ordered_attributes) and ordered_attributes[position] in held:
+                ordered_name = ordered_attributes[position]
+                handlers[ordered_name](self, {ordered_name: held.pop(ordered_name)}, ordered_name)
+                position += 1
+            if position == len(ordered_attributes):
+                for held_name, held_value in held.items():
+                    handlers[held_name](self, {held_name: held_value}, held_name)
+                held.clear()
+        # --- the pairs held back behind a missing ordered attribute ---
+        for ordered_name in ordered_attributes[position:]:
+            if ordered_name in held:
+                handlers[ordered_name](self, {ordered_name: held.pop(ordered_name)}, ordered_name)
+        for held_name, held_value in held.items():
+            handlers[held_name](self, {held_name: held_value}, held_name)
+        stock_handlers = _stock_from_dict_handlers()
+        for property_name, handler, _ in table:
+            if property_name not in handled and handler not in stock_handlers:
+                handler(self, {}, property_name)
 
     # ---------------------------------------------------------------------------------------------------------------- #
     # --- Update by de-serializing from a dict ----------------------------------------------------------------------- #
@@ -781,10 +1374,11 @@ class GenericParsable(Parsable):
             property_name: str
                 The name of the attribute to populate.
         """
-        if hasattr(self, name := "update_" + property_name) and callable(updater := getattr(self, name)):
-            updater(input_value)
+        updater_name = _updater_name(type(self), property_name)
+        if updater_name is not None:
+            getattr(self, updater_name)(input_value)
         elif properties.can_set(self, property_name):
-            self.__setattr__(property_name, input_value)
+            setattr(self, property_name, input_value)
         else:
             loghandler.debug("Unable to update property [", property_name, "].", record_location=True)
 
@@ -800,11 +1394,33 @@ class GenericParsable(Parsable):
                 The name of the attribute to populate.
         """
         if only_if_missing:
-            if hasattr(self, "has_" + property_name):
-                if self.__getattribute__("has_" + property_name):
-                    return
-        if property_name in input_value:
-            self.update_property(input_value.get(property_name), property_name)
+            presence_name = _presence_name(type(self), property_name)
+            if presence_name is not None and getattr(self, presence_name):
+                return
+        value = input_value.get(property_name, _MISSING)
+        if value is not _MISSING:
+            self.update_property(value, property_name)
+
+    def update_numeric_property(self, only_if_missing: bool, input_value: dict, property_name: str):
+        """Retrieves a numeric sequence from the input dictionary and populates the attribute with an array if desired.
+
+        Args:
+            only_if_missing: bool
+                Indicates whether the attribute should be updated only if it does not currently have a value assigned.
+            input_value: dict
+                The input dictionary of serialized attributes in which to deserialize.
+            property_name: str
+                The name of the attribute to populate, which must be named in `_numeric_serializable_attributes`.
+        """
+        if only_if_missing:
+            presence_name = _presence_name(type(self), property_name)
+            if presence_name is not None and getattr(self, presence_name):
+                return
+        value = input_value.get(property_name, _MISSING)
+        if value is not _MISSING:
+            if isinstance(value, list):
+                value = np.asarray(value, dtype=self._numeric_serializable_attributes[property_name])
+            self.update_property(value, property_name)
 
     def update_enum_property(self, only_if_missing: bool, input_value: dict, property_name: str):
         """Retrieves the enum value from the input dictionary and populates the desired attribute if desired.
@@ -845,13 +1461,13 @@ class GenericParsable(Parsable):
                 The name of the attribute to populate.
         """
         if only_if_missing:
-            if hasattr(self, "has_" + property_name):
-                if self.__getattribute__("has_" + property_name):
-                    return
-        if property_name in input_value:
-            value = input_value.get(property_name)
+            presence_name = _presence_name(type(self), property_name)
+            if presence_name is not None and getattr(self, presence_name):
+                return
+        value = input_value.get(property_name, _MISSING)
+        if value is not _MISSING:
             if isinstance(value, dict):
-                value = GenericParsable.parsed_dict(value)
+                value = _parsed_dict(value)
             self.update_property(value, property_name)
 
     def update_list_of_parsable_property(self, only_if_missing: bool, input_value: dict, property_name: str):
@@ -868,13 +1484,13 @@ class GenericParsable(Parsable):
                 The name of the attribute to populate.
         """
         if only_if_missing:
-            if hasattr(self, "has_" + property_name):
-                if self.__getattribute__("has_" + property_name):
-                    return
-        if property_name in input_value:
-            value = input_value.get(property_name)
+            presence_name = _presence_name(type(self), property_name)
+            if presence_name is not None and getattr(self, presence_name):
+                return
+        value = input_value.get(property_name, _MISSING)
+        if value is not _MISSING:
             if isinstance(value, list):
-                value = GenericParsable.parsed_list(value)
+                value = _parsed_list(value)
             self.update_property(value, property_name)
 
     def update_specialized_property(self, only_if_missing: bool, input_value: dict, property_name: str):
@@ -893,35 +1509,21 @@ class GenericParsable(Parsable):
         Raises:
             AttributeError: If the GenericParsable subclass does not have a method named ''property_name'_decode'.
         """
-        if hasattr(self, property_name + '_decode'):
+        decoder_name = _decoder_name(type(self), property_name)
+        if decoder_name is not None:
             if only_if_missing:
-                if hasattr(self, "has_" + property_name):
-                    if self.__getattribute__("has_" + property_name):
-                        return
-            if property_name in input_value:
-                self.__getattribute__(property_name + '_decode')(input_value.get(property_name))
+                presence_name = _presence_name(type(self), property_name)
+                if presence_name is not None and getattr(self, presence_name):
+                    return
+            value = input_value.get(property_name, _MISSING)
+            if value is not _MISSING:
+                getattr(self, decoder_name)(value)
         else:
             loghandler.log_and_raise(AttributeError, "Unable to decode attribute [", property_name,
                                  "] since there is no function [", property_name + '_decode', "].")
 
     def update(self, only_if_missing: bool, input_value: dict):
-        ordered_attributes, unordered_attributes = self.split_ordered_and_unordered_attributes()
-
-        for property_name in (*ordered_attributes, *unordered_attributes):
-            if property_name in self._serializable_attributes:
-                self.update_serializable_property(only_if_missing, input_value, property_name)
-            elif property_name in self._parsable_attributes:
-                self.update_parsable_property(only_if_missing, input_value, property_name)
-            elif property_name in self._enum_attributes:
-                self.update_enum_property(only_if_missing, input_value, property_name)
-            elif property_name in self._dict_of_parsables:
-                self.update_dict_of_parsable_property(only_if_missing, input_value, property_name)
-            elif property_name in self._list_of_parsables:
-                self.update_list_of_parsable_property(only_if_missing, input_value, property_name)
-            elif property_name in self._specialized_attributes:
-                self.update_specialized_property(only_if_missing, input_value, property_name)
-            else:
-                loghandler.log_and_raise(RuntimeError, "The property [", property_name, "] doesn't exist!")
+        _dispatcher(self, _UPDATE_HANDLERS)(self, only_if_missing, input_value)
 
     # ---------------------------------------------------------------------------------------------------------------- #
     # --- Equality --------------------------------------------------------------------------------------------------- #
@@ -938,49 +1540,20 @@ class GenericParsable(Parsable):
             bool:
                 If the two parsables are equal.
         """
+        other = properties.materialize(other)
         if type(self) != type(other):
             return False
 
-        for property_name in self._serializable_attributes:
-            self_value, other_value, equals = self.equals_property_name(other, property_name)
-            if equals:
-                continue
-            elif equals is False or not equal(self_value, other_value, **kwargs):
-                return False
-
-        for property_name in self._enum_attributes:
-            self_value, other_value, equals = self.equals_property_name(other, property_name)
-            if equals:
-                continue
-            elif equals is False or not equal(self_value, other_value, **kwargs):
-                return False
-
-        for property_name in self._parsable_attributes:
-            self_value, other_value, equals = self.equals_property_name(other, property_name)
-            if equals:
-                continue
-            elif equals is False or not equal(self_value, other_value, **kwargs):
-                return False
-
-        for property_name in self._dict_of_parsables:
-            self_value, other_value, equals = self.equals_property_name(other, property_name)
-            if equals:
-                continue
-            elif equals is False or not equal(self_value, other_value, **kwargs):
-                return False
-
-        for property_name in self._list_of_parsables:
-            self_value, other_value, equals = self.equals_property_name(other, property_name)
-            if equals:
-                continue
-            elif equals is False or not equal(self_value, other_value, **kwargs):
-                return False
-
-        for property_name in self._specialized_attributes:
+        # --- the comparison is the same for every category, so the registrations are walked in a single loop ---
+        for property_name in itertools.chain(self._serializable_attributes, self._enum_attributes,
+                                             self._parsable_attributes, self._dict_of_parsables,
+                                             self._list_of_parsables, self._specialized_attributes):
             self_value, other_value, equals = self.equals_property_name(other, property_name)
-            if equals:
-                continue
-            elif equals is False or not equal(self_value, other_value, **kwargs):
+            # --- values present on both sides are the common case, so they are tested first ---
+            if equals is None:
+                if not equal(self_value, other_value, **kwargs):
+                    return False
+            elif not equals:
                 return False
 
         return True
@@ -999,17 +1572,70 @@ class GenericParsable(Parsable):
                 The value of the properties from self + other (if both Parsables had the property) and if we can short
                 circuit the evaluation. If the third item in the tuple is not None, we don't need to compare the values.
         """
-        if hasattr(self, 'has_' + property_name):
-            self_has_property = self.__getattribute__('has_' + property_name)
-            other_has_property = other.__getattribute__('has_' + property_name)
-            if not self_has_property and not other_has_property:
-                return None, None, True
-            elif self_has_property != other_has_property:
+        presence_name = _presence_name(type(self), property_name)
+        if presence_name is not None:
+            # --- a value missing on self is equal only to a value missing on other ---
+            if not getattr(self, presence_name):
+                return None, None, not getattr(other, presence_name)
+            if not getattr(other, presence_name):
                 return None, None, False
 
-        self_value = self.__getattribute__(property_name)
-        other_value = other.__getattribute__(property_name)
-        if type(self_value) != type(other_value):
+        self_value = properties.materialize(getattr(self, property_name))
+        other_value = properties.materialize(getattr(other, property_name))
+        # --- classes are compared by identity, which skips the rich comparison of the metaclass ---
+        if type(self_value) is not type(other_value):
             return None, None, False
 
         return self_value, other_value, None
+
+
+# --- the container parsers bound once, so the handlers call them without looking them up on the class ---
+_parsed_dict = GenericParsable.parsed_dict
+_parsed_list = GenericParsable.parsed_list
+
+
+class ImmutableParsable(GenericParsable):
+    """A GenericParsable that is compared through the canonical bytes of its serialized representation.
+
+    Notes:
+        The canonical bytes are the JSON encoding of `to_dict()` with sorted keys. They are computed on the first
+        comparison and reused afterwards, so assigning an attribute once the instance has been compared raises an
+        AttributeError. Mutating a nested value in place is not detected and must be avoided by the caller.
+
+        Two instances whose attributes serialize identically compare equal, even if, for example, their numpy arrays
+        have different dtypes. Comparisons given a tolerance such as `rtol` or `atol` use the attribute by attribute
+        comparison of GenericParsable.
+    """
+    __slots__ = ('_canonical_cache',)
+
+    def __setattr__(self, name: str, value: Any):
+        if getattr(self, '_canonical_cache', None) is not None:
+            loghandler.log_and_raise(AttributeError, "The attribute [", name, "] of [", self.__class__.__name__,
+                                     "] cannot be assigned after the object has been compared.")
+        object.__setattr__(self, name, value)
+
+    def canonical_bytes(self) -> bytes:
+        """Returns the JSON encoding of the serialized representation of this object with sorted keys."""
+        output = getattr(self, '_canonical_cache', None)
+        if output is None:
+            output = io.to_json_str(self.to_dict(), sort_keys=True).encode()
+            object.__setattr__(self, '_canonical_cache', output)
+        return output
+
+    def equals(self, other: GenericParsable, **kwargs) -> bool:
+        """Returns if the serialized representation of other ImmutableParsable is equal to the one of self.
+
+        Args:
+            other: GenericParsable
+                The object to compare with self.
+
+        Returns:
+            bool:
+                If the two parsables are equal.
+        """
+        if kwargs:
+            return super().equals(other, **kwargs)
+        other = properties.materialize(other)
+        if type(self) != type(other):
+            return False
+        return self.canonical_bytes() == other.canonical_bytes()
@@ -1,8 +1,98 @@
-import abc
-import importlib
+from typing import Any, Callable, Optional, Tuple
+import copy
+import functools
+import importlib.metadata
+import operator
+import threading
+import types
 
 from . import loghandler, properties
 
+# --- default of attribute lookups that must tell a missing attribute apart from an attribute set to None ---
+_MISSING = object()
+
+# --- the plugin class and module keywords of each plugin class, gathered once per class ---
+_plugin_keywords = {}
+
+# --- the import errors of module and class names whose module does not exist, which are not retried ---
+_failed_imports = {}
+
+# --- serializes the writes to the plugin registries, which are read without taking it ---
+_registry_lock = threading.Lock()
+
+# --- plugins installed by other distributions are advertised in this entry point group, suffixed by the base class ---
+_ENTRY_POINT_GROUP = "ml_ontogenesis.plugins."
+
+
+@functools.lru_cache(maxsize=None)
+def _plugin_entry_points(base_name: str) -> types.MappingProxyType:
+    """Returns the entry points advertising plugins of a base class by plugin name, read once per base class.
+
+    Notes:
+        A distribution declares its plugins of, for example, ParametersBase in the group
+        'ml_ontogenesis.plugins.ParametersBase' with the class name as the entry point name. The entry points are
+        only loaded when their plugin is looked up, so installed plugins cost nothing until they are used.
+    """
+    entry_points = importlib.metadata.entry_points(group=_ENTRY_POINT_GROUP + base_name)
+    return types.MappingProxyType({entry_point.name: entry_point for entry_point in entry_points})
+
+
+def clear_failed_imports():
+    """Forgets the modules found missing, so that their plugins are imported again once the modules are installed."""
+    _failed_imports.clear()
+
+
+def _read_plugin_names_from_dict(parameters: dict, plugin_property_name: str,
+                                 plugin_module_property_name: Optional[str]) -> Tuple[Any, Any]:
+    """Reads the plugin class and module names from a dictionary of parameters."""
+    class_name = parameters.get(plugin_property_name, _MISSING)
+    if class_name is _MISSING:
+        loghandler.log_and_raise(RuntimeError, "Unable to extract plugin property name [", plugin_property_name,
+                                 "] from dict object. Unable to generate Plugin!")
+    if plugin_module_property_name is None:
+        return class_name, None
+    module_name = parameters.get(plugin_module_property_name, _MISSING)
+    if module_name is _MISSING:
+        loghandler.log_and_raise(RuntimeError, "Unable to extract plugin module name [", plugin_module_property_name,
+                                 "] from dict object. Unable to generate Plugin!")
+    return class_name, module_name
+
+
+def _plugin_name_reader(parameters_type: type, property_name: str) -> Callable[[Any], Any]:
+    """Returns a function reading a plugin name from parameters of a type, checking its 'has_' property if any."""
+    presence_name = 'has_' + property_name
+    if not hasattr(parameters_type, presence_name):
+        return operator.attrgetter(property_name)
+
+    def read_plugin_name(parameters):
+        if not getattr(parameters, presence_name):
+            loghandler.log_and_raise(RuntimeError, "The plugin property name [", property_name,
+                                                   "] has not been assigned to the provided parameters object [",
+                                                   type(parameters), "]. Unable to generate Plugin!")
+        return getattr(parameters, property_name)
+
+    return read_plugin_name
+
+
+@functools.lru_cache(maxsize=256)
+def _plugin_name_readers(parameters_type: type, plugin_property_name: str,
+                         plugin_module_property_name: Optional[str]) -> Tuple[Callable, Optional[Callable]]:
+    """Returns the functions reading the plugin class and module names from parameters objects of a type.
+
+    Notes:
+        Which properties to read and whether they are guarded by a 'has_' property only depends on the type of the
+        parameters and the plugin keywords, so the readers are built once per type and keywords. Types that do not
+        define the plugin property raise and are therefore not memoized.
+    """
+    if not hasattr(parameters_type, plugin_property_name):
+        loghandler.log_and_raise(RuntimeError, "Unable to extract plugin property name [",
+                                               plugin_property_name, "] from parameters object [",
+                                               parameters_type, "]. Unable to generate Plugin!")
+    read_class_name = _plugin_name_reader(parameters_type, plugin_property_name)
+    if plugin_module_property_name is None:
+        return read_class_name, None
+    return read_class_name, _plugin_name_reader(parameters_type, plugin_module_property_name)
+
 
 def get_subclass_map(class_type, class_map: dict) -> dict:
     """
@@ -46,9 +136,95 @@ def get_subclass_map(class_type, class_map: dict) -> dict:
     return class_map
 
 
-class PluginBase(metaclass=abc.ABCMeta):
+class LazyPlugin:
+    """A stand-in for a plugin that is only looked up and constructed when one of its attributes is used.
+
+    Notes:
+        Neither the module of the plugin is imported nor the plugin constructed until then, so plugins that are
+        configured but never used cost nothing. Errors of the lookup and of the constructor are raised on first use.
+        Calls, comparisons, hashing, truth tests, `len`, indexing, iteration, copies and pickling are forwarded to the
+        constructed plugin. `isinstance` checks look up the class of the plugin without constructing it, and `type()`
+        of the stand-in remains LazyPlugin.
+    """
+    __slots__ = ('_plugin_base', '_class_name', '_class_module', '_args', '_kwargs', '_real')
+
+    def __init__(self, plugin_base: type, class_name: str, class_module: Optional[str], args: tuple, kwargs: dict):
+        object.__setattr__(self, '_plugin_base', plugin_base)
+        object.__setattr__(self, '_class_name', class_name)
+        object.__setattr__(self, '_class_module', class_module)
+        object.__setattr__(self, '_args', args)
+        object.__setattr__(self, '_kwargs', kwargs)
+        object.__setattr__(self, '_real', None)
+
+    def _materialize(self):
+        real = self._real
+        if real is None:
+            real = self._plugin_base.construct(self._class_name, *self._args, class_module=self._class_module,
+                                               **self._kwargs)
+            object.__setattr__(self, '_real', real)
+            object.__setattr__(self, '_args', None)
+            object.__setattr__(self, '_kwargs', None)
+        return real
+
+    @property
+    def __class__(self):
+        real = self._real
+        if real is not None:
+            return type(real)
+        return self._plugin_base.lookup(self._class_name, self._class_module, self._kwargs)
+
+    def __getattr__(self, name: str):
+        if name in LazyPlugin.__slots__:
+            raise AttributeError(name)
+        return getattr(self._materialize(), name)
+
+    def __setattr__(self, name: str, value):
+        setattr(self._materialize(), name, value)
+
+    def __repr__(self) -> str:
+        if self._real is not None:
+            return repr(self._real)
+        return "LazyPlugin(" + repr(self._class_name) + ")"
+
+    def __call__(self, *args, **kwargs):
+        return self._materialize()(*args, **kwargs)
+
+    def __len__(self) -> int:
+        return len(self._materialize())
+
+    def __getitem__(self, key):
+        return self._materialize()[key]
+
+    def __iter__(self):
+        return iter(self._materialize())
+
+    def __bool__(self) -> bool:
+        return bool(self._materialize())
+
+    def __eq__(self, other) -> bool:
+        if type(other) is LazyPlugin:
+            other = other._materialize()
+        return self._materialize() == other
+
+    def __hash__(self) -> int:
+        return hash(self._materialize())
+
+    def __copy__(self):
+        return copy.copy(self._materialize())
+
+    def __deepcopy__(self, memo: dict):
+        return copy.deepcopy(self._materialize(), memo)
+
+    def __reduce_ex__(self, protocol: int):
+        return self._materialize().__reduce_ex__(protocol)
+
+    def __reduce__(self):
+        return self._materialize().__reduce__()
+
+
+class PluginBase:
     """
-    Abstract base class for creating a plugin system.
+    Base class for creating a plugin system.
 
     This class provides a framework for registering, discovering, and instantiating plugins dynamically. It uses
     a class-level dictionary to maintain a registry of plugin subclasses, which can be accessed and manipulated
@@ -57,33 +233,47 @@ class PluginBase(metaclass=abc.ABCMeta):
 
     Attributes:
         - _registered_plugins (dict): Class-level attribute to store registered plugins.
-          This is initially None and is intended to be a dictionary where keys are plugin
-          class names and values are the plugin classes themselves.
+          This is a dictionary where keys are plugin class names and values are the plugin
+          classes themselves. Every subclass registers itself when it is defined, so the
+          registry never has to be rebuilt by walking the subclasses. The registry of
+          PluginBase holds every plugin; a class calling `add_registry` or defining its own
+          `_registered_plugins` keeps a separate registry of its subclasses only.
 
     Methods:
         - __init__(*args, **kwargs): Constructor for the PluginBase class. It allows for
           flexible instantiation but does not perform any action by itself.
+        - __init_subclass__(**kwargs): Registers every subclass by its class name in the
+          registries of all of its bases when it is defined. A later subclass with the same
+          name replaces the earlier one.
 
     Class Methods:
         - add_registry(): Ensures the existence of the '_registered_plugins' dictionary
-          at the class level.
+          in the class itself, holding the subclasses defined so far.
         - has_registry(): Checks if the '_registered_plugins' dictionary exists at the
           class level.
         - has_registered_class(class_name): Checks if a given class name is registered
           in the plugin registry.
+        - plugins(): Returns a read-only view of the plugin registry, which reflects the
+          subclasses defined later.
         - get_class(class_name, class_module=None, input_values=None): Retrieves a class
           from the registry or dynamically imports and returns it based on class name and
-          optional module name.
+          optional module name. Classes advertised by installed distributions in the entry
+          point group 'ml_ontogenesis.plugins.<base class name>' are imported when first
+          looked up. Returns None if the class cannot be imported, logging a warning. If
+          the module itself does not exist, the import is not attempted again for the same
+          module and class name until `clear_failed_imports` is called.
         - gather_plugin_class_and_module_keywords(): Extracts plugin class and module
           names based on predefined class attributes or parameters.
         - extract_plugin_class_and_module_names(parameters, use_default): Extracts the
           class and module names for a plugin based on provided parameters or defaults.
         - lookup(class_name, class_module, input_values=None): Looks up and returns a
           registered subclass or dynamically loads one based on class name and optional
-          module name.
+          module name. The error of a failed import is chained to the raised RuntimeError.
         - construct(class_name, *args, class_module=None, **kwargs): Instantiates a plugin
           based on the class name and optional module name, passing any additional args
           and kwargs.
+        - construct_lazy(class_name, *args, class_module=None, **kwargs): Same as `construct`,
+          but returns a LazyPlugin which only looks up and constructs the plugin when used.
         - construct_from_parameters(parameters, *args, use_default=False, **kwargs):
           Instantiates a plugin based on parameters that specify the plugin class and
           optionally its module, passing any additional args and kwargs.
@@ -97,77 +287,94 @@ class PluginBase(metaclass=abc.ABCMeta):
     Usage:
     PluginBase should not be instantiated directly but subclassed by specific plugin implementations. Subclasses may
     override methods as needed to provide specific functionality related to plugin discovery, loading, and
-    instantiation.
+    instantiation. PluginBase is a plain class without a metaclass, as it declares no abstract methods and registers
+    its subclasses through `__init_subclass__`. It declares empty `__slots__`, so subclasses declaring their own
+    `__slots__` for their state are instantiated without a per-instance `__dict__`.
 
     """
-    _registered_plugins = None
+    __slots__ = ()
+    _registered_plugins = {}
 
     def __init__(self, *args, **kwargs):
         pass
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        with _registry_lock:
+            for klass in cls.__mro__[1:]:
+                registry = klass.__dict__.get('_registered_plugins')
+                if registry is not None:
+                    registry[cls.__name__] = cls
+
     @classmethod
     def add_registry(cls):
-        if not hasattr(type(cls), '_registered_plugins'):
-            setattr(type(cls), '_registered_plugins', dict())
+        if cls.__dict__.get('_registered_plugins') is None:
+            with _registry_lock:
+                # --- checked again, since another thread may have added the registry in the meantime ---
+                if cls.__dict__.get('_registered_plugins') is None:
+                    cls._registered_plugins = get_subclass_map(cls, {})
 
     @classmethod
     def has_registry(cls):
-        return hasattr(type(cls), '_registered_plugins')
+        return cls._registered_plugins is not None
+
+    @classmethod
+    def plugins(cls):
+        return types.MappingProxyType(cls._registered_plugins)
 
     @classmethod
     def has_registered_class(cls, class_name):
-        if not cls.has_registry():
-            return False
-        return class_name in type(cls)._registered_plugins
+        return class_name in cls._registered_plugins
 
     @classmethod
     def get_class(cls, class_name, class_module=None, input_values=None):
-        if not cls.has_registry():
-            cls.add_registry()
-        if cls.has_registered_class(class_name):
-            return type(cls)._registered_plugins.get(class_name)
-        else:
-            subclasses = dict()
-            subclasses = get_subclass_map(cls, subclasses)
-            if class_name in subclasses:
-                type(cls)._registered_plugins.update(**subclasses)
-                return subclasses.get(class_name)
-            else:
-                if class_module is None and input_values is None:
-                    return None
-                elif class_module is None:
-                    _, class_module = properties.ParsableProperty.get_class_and_module_strings(input_values,
-                                                                                               parsable_class=class_name)
-                if class_module is None:
-                    return None
-                imported_module = importlib.import_module(class_module)
-                class_type = getattr(imported_module, class_name)
-                subclasses = dict()
-                subclasses = get_subclass_map(cls, subclasses)
-                if class_type.__name__ in subclasses:
-                    type(cls)._registered_plugins.update(**subclasses)
-                return class_type
+        return cls._get_class_or_import_error(class_name, class_module, input_values)[0]
+
+    @classmethod
+    def _get_class_or_import_error(cls, class_name, class_module, input_values):
+        """Returns the class looked up by `get_class` and the error of its failed import, either of which is None."""
+        # --- subclasses register themselves when defined, so a miss means the class has not been imported yet ---
+        class_type = cls._registered_plugins.get(class_name)
+        if class_type is not None:
+            return class_type, None
+        # --- plugins of installed distributions register themselves once their entry point is loaded ---
+        entry_point = _plugin_entry_points(cls.__name__).get(class_name)
+        if entry_point is not None:
+            return entry_point.load(), None
+        if class_module is None and input_values is not None:
+            _, class_module = properties.ParsableProperty.get_class_and_module_strings(input_values,
+                                                                                       parsable_class=class_name)
+        if class_module is None:
+            return None, None
+        error = _failed_imports.get((class_module, class_name))
+        if error is not None:
+            return None, error
+        try:
+            return properties.resolve_class(class_module, class_name), None
+        except (ImportError, AttributeError) as import_error:
+            # --- only a missing module is remembered; errors raised while importing it may be fixed on retry ---
+            if isinstance(import_error, ModuleNotFoundError) and import_error.name == class_module:
+                _failed_imports[(class_module, class_name)] = import_error
+            loghandler.warning("Unable to import [", class_name, "] from module [", class_module, "]: ",
+                               import_error, record_location=True)
+            return None, import_error
 
     @classmethod
     def gather_plugin_class_and_module_keywords(cls):
-        if type(cls) is type(PluginBase):
-            plugin_property_name = None
-            plugin_module_property_name = None
-            if hasattr(cls, 'parameters_cls'):
-                if hasattr(cls.parameters_cls, 'plugin_property_name'):
-                    plugin_property_name = cls.parameters_cls.plugin_property_name
-                if hasattr(cls.parameters_cls, 'plugin_module_property_name'):
-                    plugin_module_property_name = cls.parameters_cls.plugin_module_property_name
-            else:
-                if hasattr(cls, 'plugin_property_name'):
-                    plugin_property_name = cls.plugin_property_name
-                if hasattr(cls, 'plugin_module_property_name'):
-                    plugin_module_property_name = cls.plugin_module_property_name
-            return plugin_property_name, plugin_module_property_name
+        keywords = _plugin_keywords.get(cls)
+        if keywords is not None:
+            return keywords
+        if cls is not PluginBase:
+            parameters_cls = getattr(cls, 'parameters_cls', _MISSING)
+            source = cls if parameters_cls is _MISSING else parameters_cls
+            plugin_property_name = getattr(source, 'plugin_property_name', None)
+            plugin_module_property_name = getattr(source, 'plugin_module_property_name', None)
+            keywords = _plugin_keywords[cls] = (plugin_property_name, plugin_module_property_name)
+            return keywords
         else:
-            raise RuntimeError(loghandler.error("Unable to deduce base class plugin properties in this class method "
-                                                "when PluginBase is used as the base class. Try using a more specific base"
-                                                " class implementation.", record_location=True))
+            loghandler.log_and_raise(RuntimeError, "Unable to deduce base class plugin properties in this class "
+                                                   "method when PluginBase is used as the base class. Try using a "
+                                                   "more specific base class implementation.")
 
     @classmethod
     def extract_plugin_class_and_module_names(cls, parameters, use_default):
@@ -177,78 +384,36 @@ class PluginBase(metaclass=abc.ABCMeta):
         else:
             plugin_property_name, plugin_module_property_name = cls.gather_plugin_class_and_module_keywords()
         if plugin_property_name is None:
-            raise RuntimeError(loghandler.error("Unable to extract property to indicate the plugin type. Ensure"
-                                                " that either the class contains a class variable named "
-                                                "'plugin_property_name' which points to the property in the provided "
-                                                "parameters object that indicates the plugin name or a class variable "
-                                                "named 'parameters_cls' which points to the parameters class "
-                                                "which then must contain a valid 'plugin_property_name' "
-                                                "class variable. Unable to generate a plugin for class [",
-                                                type(cls), "]!", record_location=True))
+            loghandler.log_and_raise(RuntimeError, "Unable to extract property to indicate the plugin type. Ensure"
+                                                   " that either the class contains a class variable named "
+                                                   "'plugin_property_name' which points to the property in the "
+                                                   "provided parameters object that indicates the plugin name or a "
+                                                   "class variable "
+                                                   "named 'parameters_cls' which points to the parameters class "
+                                                   "which then must contain a valid 'plugin_property_name' "
+                                                   "class variable. Unable to generate a plugin for class [",
+                                                   type(cls), "]!")
         if isinstance(parameters, dict):
-            if plugin_property_name not in parameters:
-                raise RuntimeError(loghandler.error("Unable to extract plugin property name [",
-                                                    plugin_property_name,
-                                                    "] from dict object. Unable to generate Plugin!",
-                                                    record_location=True))
-            else:
-                class_name = parameters.get(plugin_property_name)
-
-            if plugin_module_property_name is not None:
-                if plugin_module_property_name not in parameters:
-                    raise RuntimeError(loghandler.error("Unable to extract plugin module name [",
-                                                        plugin_module_property_name,
-                                                        "] from dict object. Unable to generate Plugin!",
-                                                        record_location=True))
-                else:
-                    module_name = parameters.get(plugin_module_property_name)
-            else:
-                module_name = None
-        else:
-            if not hasattr(type(parameters), plugin_property_name):
-                raise RuntimeError(loghandler.error("Unable to extract plugin property name [",
-                                                    plugin_property_name, "] from parameters object [",
-                                                    type(parameters), "]. Unable to generate Plugin!",
-                                                    record_location=True))
-            if hasattr(parameters, 'has_' + plugin_property_name):
-                if getattr(parameters, 'has_' + plugin_property_name):
-                    class_name = getattr(parameters, plugin_property_name)
-                else:
-                    raise RuntimeError(loghandler.error("The plugin property name [", plugin_property_name,
-                                                        "] has not been assigned to the provided parameters object [",
-                                                        type(parameters), "]. Unable to generate Plugin!",
-                                                        record_location=True))
-            else:
-                class_name = getattr(parameters, plugin_property_name)
-
-            if plugin_module_property_name is not None:
-                if hasattr(parameters, 'has_' + plugin_module_property_name):
-                    if getattr(parameters, 'has_' + plugin_module_property_name):
-                        module_name = getattr(parameters, plugin_module_property_name)
-                    else:
-                        raise RuntimeError(loghandler.error("The plugin property name [", plugin_module_property_name,
-                                                            "] has not been assigned to the provided parameters "
-                                                            "object [",
-                                                            type(parameters), "]. Unable to generate Plugin!",
-                                                            record_location=True))
-                else:
-                    module_name = getattr(parameters, plugin_module_property_name)
-            else:
-                module_name = None
-
-        return class_name, module_name
+            return _read_plugin_names_from_dict(parameters, plugin_property_name, plugin_module_property_name)
+        read_class_name, read_module_name = _plugin_name_readers(type(parameters), plugin_property_name,
+                                                                 plugin_module_property_name)
+        return read_class_name(parameters), None if read_module_name is None else read_module_name(parameters)
 
     @classmethod
     def lookup(cls, class_name, class_module, input_values=None):
-        output_class = cls.get_class(class_name, class_module, input_values)
+        output_class, error = cls._get_class_or_import_error(class_name, class_module, input_values)
         if output_class is None:
-            raise RuntimeError(loghandler.error("Subclass [", class_name, "] is not registered", record_location=True))
+            loghandler.log_and_raise(RuntimeError, "Subclass [", class_name, "] is not registered", cause=error)
         return output_class
 
     @classmethod
     def construct(cls, class_name, *args, class_module=None, **kwargs):
         return cls.lookup(class_name, class_module, kwargs)(*args, **kwargs)
 
+    @classmethod
+    def construct_lazy(cls, class_name, *args, class_module=None, **kwargs):
+        return LazyPlugin(cls, class_name, class_module, args, kwargs)
+
     @classmethod
     def construct_from_parameters(cls, parameters: object, *args: object, use_default: bool = False,
                                   **kwargs: object):
@@ -263,8 +428,8 @@ class PluginBase(metaclass=abc.ABCMeta):
             output_instance.from_dict(kwargs)
             return output_instance
         else:
-            raise RuntimeError(loghandler.error("Class [", output_class.__name__,
-                                                "] does not have a function named 'from_dict'", record_location=True))
+            loghandler.log_and_raise(RuntimeError, "Class [", output_class.__name__,
+                                                   "] does not have a function named 'from_dict'")
 
     @classmethod
     def parse_from_parameters(cls, parameters, *args, use_default=False, **kwargs):
@@ -1,49 +1,96 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
 import copy
-from enum import Enum
-from typing import List, Optional, Type, Union
 import importlib
 import inspect
 import functools
+import types
+import weakref
 
 from . import loghandler
 
+if TYPE_CHECKING:
+    from enum import Enum
+    from typing import Any, Dict, FrozenSet, List, Mapping, Optional, Tuple, Type, Union
+
 generic_parsable_type = "parsable_type"
 generic_parsable_module = "parsable_module"
 
 
-def required_parameter_for_class_init(class_type) -> List[str]:
+@functools.lru_cache(maxsize=None)
+def required_parameter_for_class_init(class_type) -> FrozenSet[str]:
+    """Collects the names of the arguments without defaults required by the constructors of a class and its bases.
+
+    Notes:
+        The result only depends on the class hierarchy, so it is computed once per class and memoized. The code object
+        of each constructor is read directly instead of building an `inspect.Signature`. Constructors implemented in C
+        expose no code object and are skipped, as they do not declare named arguments.
+
+    Args:
+        class_type: type
+            The class whose constructor arguments are inspected.
+
+    Returns:
+        FrozenSet[str]:
+            The names of the required constructor arguments.
+    """
     required_args = set()
-    signature = inspect.signature(class_type.__init__)
-    for name, parameter in signature.parameters.items():
-        if parameter.default == parameter.empty and parameter.name != "self" and parameter.kind not in (
-                parameter.VAR_POSITIONAL, parameter.VAR_KEYWORD):
-            required_args.add(parameter.name)
-    for base in class_type.__bases__:
-        required_args = required_args.union(set(required_parameter_for_class_init(base)))
-    return list(required_args)
+    for klass in class_type.__mro__[:-1]:
+        init = klass.__dict__.get('__init__')
+        if init is None:
+            continue
+        init = inspect.unwrap(init)
+        code = getattr(init, '__code__', None)
+        if code is None:
+            continue
+        # --- positional arguments without a default ---
+        positional_count = code.co_argcount
+        defaults_count = len(init.__defaults__ or ())
+        required_args.update(code.co_varnames[:positional_count - defaults_count])
+        # --- keyword-only arguments without a default ---
+        keyword_only = code.co_varnames[positional_count:positional_count + code.co_kwonlyargcount]
+        keyword_defaults = init.__kwdefaults__ or {}
+        required_args.update(name for name in keyword_only if name not in keyword_defaults)
+    required_args.discard("self")
+    return frozenset(required_args)
+
+
+@functools.lru_cache(maxsize=1024)
+def get_all_properties(class_type) -> Mapping[str, Any]:
+    """Collects the attributes defined on a class and all of its bases.
+
+    Notes:
+        The MRO is walked once per class and the result is memoized. Attributes defined on a subclass take precedence
+        over those of its bases, matching regular attribute resolution.
 
+    Args:
+        class_type: type
+            The class whose attributes are collected.
 
-def get_all_properties(obj, more_properties: dict) -> dict:
-    more_properties.update(obj.__dict__)
-    for b in obj.__bases__:
-        more_properties = get_all_properties(b, more_properties)
-    return more_properties
+    Returns:
+        Mapping[str, Any]:
+            A read-only mapping of attribute names to the attributes found in the class dictionaries.
+    """
+    all_properties = dict()
+    for klass in reversed(class_type.__mro__):
+        all_properties.update(klass.__dict__)
+    return types.MappingProxyType(all_properties)
 
 
 def is_property(obj, key):
     if not isinstance(obj, type):
         obj = type(obj)
-    pro = get_all_properties(obj, dict()).get(key)
+    pro = get_all_properties(obj).get(key)
     return isinstance(pro, property)
 
 
 def _get_property(obj, key):
     if not isinstance(obj, type):
         obj = type(obj)
-    pro = get_all_properties(obj, dict()).get(key)
+    pro = get_all_properties(obj).get(key)
     if not isinstance(pro, property):
         raise RuntimeError(loghandler.error('{.__name__}.{} is not a property its a '.format(obj, key), type(pro),
-                                            " and the object has ", get_all_properties(obj, dict())))
+                                            " and the object has ", dict(get_all_properties(obj))))
     return pro
 
 
@@ -51,14 +98,61 @@ def can_get(obj, key):
     return _get_property(obj, key).fget is not None
 
 
+@functools.lru_cache(maxsize=4096)
+def _class_can_set(class_type: type, key: str) -> bool:
+    """Returns whether the property of a class has a setter, memoized per class and property name.
+
+    Notes:
+        Lookups of names that are not properties raise and are therefore not memoized.
+    """
+    return _get_property(class_type, key).fset is not None
+
+
 def can_set(obj, key):
-    return _get_property(obj, key).fset is not None
+    return _class_can_set(obj if isinstance(obj, type) else type(obj), key)
 
 
 def can_del(obj, key):
     return _get_property(obj, key).fdel is not None
 
 
+# --- classes announced by `register_class`, by module and class name, dropped once a class is garbage collected ---
+_registered_classes = weakref.WeakValueDictionary()
+
+
+def register_class(class_type: type):
+    """Makes a class resolvable by its module and class name without importing the module.
+
+    Notes:
+        Parsable subclasses are registered when they are defined, so the first deserialization of a class that has
+        already been imported does not go through the import machinery.
+    """
+    _registered_classes[(class_type.__module__, class_type.__name__)] = class_type
+
+
+def resolve_class(module_str: str, class_str: str) -> type:
+    """Returns the named class of a module, importing the module if the class has not been registered.
+
+    Notes:
+        Registered classes are looked up on every call, so a class that is redefined or reloaded resolves to its
+        latest definition and is not kept alive by this function. Only the import of unregistered classes is memoized.
+    """
+    class_type = _registered_classes.get((module_str, class_str))
+    if class_type is not None:
+        return class_type
+    return _import_class(module_str, class_str)
+
+
+@functools.lru_cache(maxsize=4096)
+def _import_class(module_str: str, class_str: str) -> type:
+    """Imports a module and returns the named class from it, memoizing the lookup per module and class name.
+
+    Notes:
+        Failed lookups raise and are therefore not memoized, so a module that becomes importable later is found.
+    """
+    return getattr(importlib.import_module(module_str), class_str)
+
+
 class ParsableProperty(property):
     def __set__(self, obj, value):
         if isinstance(value, dict):
@@ -88,13 +182,14 @@ class ParsableProperty(property):
                     raise RuntimeError(msg)
             else:
                 module_str = parsable_module
-        elif parsable_module_keyword in input_value:
-            module_str = input_value[parsable_module_keyword]
         else:
-            msg = loghandler.error("Unable to deduce the module name to load for parsing.", module_str,
-                                   record_location=True)
-            if throw_if_unable_to_parse:
-                raise RuntimeError(msg)
+            # --- the keyword is looked up once, and only tested for presence when its value is None ---
+            module_str = input_value.get(parsable_module_keyword)
+            if module_str is None and parsable_module_keyword not in input_value:
+                msg = loghandler.error("Unable to deduce the module name to load for parsing.", module_str,
+                                       record_location=True)
+                if throw_if_unable_to_parse:
+                    raise RuntimeError(msg)
 
         # --- find the class to load ---
         if parsable_class is not None:
@@ -105,12 +200,12 @@ class ParsableProperty(property):
                     raise RuntimeError(msg)
             else:
                 class_str = parsable_class
-        elif parsable_class_keyword in input_value:
-            class_str = input_value[parsable_class_keyword]
         else:
-            msg = loghandler.error("Unable to deduce the class name to load for parsing.", record_location=True)
-            if throw_if_unable_to_parse:
-                raise RuntimeError(msg)
+            class_str = input_value.get(parsable_class_keyword)
+            if class_str is None and parsable_class_keyword not in input_value:
+                msg = loghandler.error("Unable to deduce the class name to load for parsing.", record_location=True)
+                if throw_if_unable_to_parse:
+                    raise RuntimeError(msg)
 
         return class_str, module_str
 
@@ -133,9 +228,8 @@ class ParsableProperty(property):
             # --- load in the class ---
             if module_str is not None and class_str is not None:
                 try:
-                    imported_module = importlib.import_module(module_str)
-                    class_type = getattr(imported_module, class_str)
-                except BaseException as error:
+                    class_type = resolve_class(module_str, class_str)
+                except (ImportError, AttributeError, TypeError) as error:
                     msg = loghandler.error("Unable to construct parsable object [", class_str,
                                            "] in module [", module_str,
                                            "]. Encountered error: [", error, "]", record_location=True)
@@ -167,7 +261,7 @@ class ParsableProperty(property):
                 output = class_type(**required_args)
                 output.from_dict(input_value)
                 input_value = output
-            except BaseException as error:
+            except (TypeError, ValueError, AttributeError, RuntimeError) as error:
                 msg = loghandler.error("Unable to construct parsable object [", class_type,
                                        "]. Encountered error: [", error, "]", record_location=True)
                 if throw_if_unable_to_parse:
@@ -177,11 +271,89 @@ class ParsableProperty(property):
     @staticmethod
     def get_required_arguments_for_init(class_type, input_dict: dict) -> dict:
         required_args = required_parameter_for_class_init(class_type)
-        if not all(arg in input_dict for arg in required_args):
-            raise RuntimeError(loghandler.error("The required arguments ", required_args,
+        if required_args - input_dict.keys():
+            raise RuntimeError(loghandler.error("The required arguments ", sorted(required_args),
                                                 " are not included in the provided arguments ",
                                                 list(input_dict.keys()), "."))
-        return dict((k, input_dict[k]) for k in required_args)
+        return {k: input_dict[k] for k in required_args}
+
+
+class LazyParsable:
+    """A stand-in for a serialized Parsable that only constructs the Parsable when one of its attributes is used.
+
+    Notes:
+        The class of the Parsable is resolved from the serialized dictionary without constructing it, so `isinstance`
+        checks against the Parsable class succeed on the stand-in. Serializing an unconstructed stand-in returns a copy of
+        the serialized dictionary, and `type()` of the stand-in remains LazyParsable. Copying or pickling an unconstructed
+        stand-in copies the serialized dictionary into a new stand-in, otherwise the constructed Parsable is copied. Use
+        `materialize` to obtain the constructed Parsable. Comparisons and hashing construct the Parsable and are
+        forwarded to it.
+    """
+    __slots__ = ('_raw', '_real')
+
+    def __init__(self, input_value: dict):
+        object.__setattr__(self, '_raw', input_value)
+        object.__setattr__(self, '_real', None)
+
+    def _materialize(self):
+        real = self._real
+        if real is None:
+            real = ParsableProperty.parse(self._raw, throw_if_unable_to_parse=True)
+            object.__setattr__(self, '_real', real)
+        return real
+
+    @property
+    def __class__(self):
+        return ParsableProperty.get_class_type(self._raw, throw_if_unable_to_parse=True)
+
+    def __getattr__(self, name: str):
+        if name in LazyParsable.__slots__:
+            raise AttributeError(name)
+        return getattr(self._materialize(), name)
+
+    def __setattr__(self, name: str, value):
+        setattr(self._materialize(), name, value)
+
+    def __repr__(self) -> str:
+        if self._real is not None:
+            return repr(self._real)
+        return "LazyParsable(" + repr(self._raw) + ")"
+
+    def to_dict(self) -> dict:
+        if self._real is not None:
+            return self._real.to_dict()
+        return copy.deepcopy(self._raw)
+
+    def __eq__(self, other) -> bool:
+        return self._materialize() == materialize(other)
+
+    def __hash__(self) -> int:
+        return hash(self._materialize())
+
+    def __copy__(self):
+        if self._real is not None:
+            return copy.copy(self._real)
+        return LazyParsable(self._raw)
+
+    def __deepcopy__(self, memo: dict):
+        if self._real is not None:
+            return copy.deepcopy(self._real, memo)
+        return LazyParsable(copy.deepcopy(self._raw, memo))
+
+    def __reduce_ex__(self, protocol: int):
+        if self._real is not None:
+            return self._real.__reduce_ex__(protocol)
+        return LazyParsable, (self._raw,)
+
+    def __reduce__(self):
+        return self.__reduce_ex__(2)
+
+
+def materialize(input_value: Any) -> Any:
+    """Returns the constructed Parsable behind a LazyParsable, or the input value itself for any other value."""
+    if type(input_value) is LazyParsable:
+        return input_value._materialize()
+    return input_value
 
 
 def enum_parse(enum_type: Type[Enum],
@@ -206,24 +378,48 @@ def enum_parse(enum_type: Type[Enum],
                 One of the items in the list passed does not correlate to an instance of the enum
                 The type passed in can not be converted to an enum
     """
+    names, values = _enum_tables(enum_type)
     if isinstance(input_value, list):
-        return [enum_parse(enum_type, x) for x in input_value]
+        return [_enum_lookup(enum_type, names, values, x) for x in input_value]
+    return _enum_lookup(enum_type, names, values, input_value)
+
+
+@functools.lru_cache(maxsize=None)
+def _enum_tables(enum_type: Type[Enum]) -> Tuple[Mapping[str, Enum], Dict[Any, Enum]]:
+    """Builds the name to member and value to member lookup tables of an Enum type once."""
+    values = dict()
+    for member in enum_type:
+        try:
+            values.setdefault(member.value, member)
+        except TypeError:
+            # --- unhashable values are resolved through the Enum constructor instead ---
+            pass
+    return enum_type.__members__, values
+
+
+def _enum_lookup(enum_type: Type[Enum], names: Mapping[str, Enum], values: Dict[Any, Enum],
+                 input_value: Union[str, int, List[Union[str, int]]]) -> Union[Optional[Enum], List[Enum]]:
+    """Resolves a single value for `enum_parse` using the precomputed lookup tables of the Enum type."""
+    # --- members are checked before names, since the members of str based Enums are strings as well ---
     if isinstance(input_value, enum_type) or input_value is None:
-        return input_value
+        converted_value = input_value
+    elif isinstance(input_value, list):
+        converted_value = [_enum_lookup(enum_type, names, values, x) for x in input_value]
     elif isinstance(input_value, str):
-        try:
-            converted_value = enum_type[input_value]
-        except KeyError:
+        converted_value = names.get(input_value)
+        if converted_value is None:
             raise TypeError(
-                loghandler.error(f"{input_value} is not a valid name of a {enum_type}", record_location=True))
+                loghandler.error(input_value, " is not a valid name of a ", enum_type, record_location=True))
     elif isinstance(input_value, int):
-        try:
-            converted_value = enum_type(input_value)
-        except ValueError:
-            raise TypeError(loghandler.error(f"Index {input_value} is not a valid index of a {enum_type}",
-                                             record_location=True))
+        converted_value = values.get(input_value)
+        if converted_value is None:
+            try:
+                converted_value = enum_type(input_value)
+            except ValueError:
+                raise TypeError(loghandler.error("Index ", input_value, " is not a valid index of a ", enum_type,
+                                                 record_location=True))
     else:
-        raise TypeError(loghandler.error(f"{input_value} can not be converted to {enum_type}", record_location=True))
+        raise TypeError(loghandler.error(input_value, " can not be converted to ", enum_type, record_location=True))
 
     return converted_value
 
@@ -235,8 +431,7 @@ def enum_setter(enum_type):
     def decorator_enum_setter(func):
         @functools.wraps(func)
         def wrapper_(self, input_value):
-            converted_value = enum_parse(enum_type, input_value)
-            func(self, converted_value)
+            func(self, enum_parse(enum_type, input_value))
 
         return wrapper_
 
@@ -249,17 +444,14 @@ def parsable_setter(parsable_module=None,
                     parsable_class_keyword=generic_parsable_type,
                     throw_if_unable_to_parse=False,
                     class_type=None):
+    parse_options = (parsable_module, parsable_class, parsable_module_keyword, parsable_class_keyword,
+                     throw_if_unable_to_parse, class_type)
+
     def decorator_parsable_setter(func):
         @functools.wraps(func)
         def parsable_parse(self, input_value):
             if isinstance(input_value, dict):
-                input_value = ParsableProperty.parse(input_value,
-                                                     parsable_module,
-                                                     parsable_class,
-                                                     parsable_module_keyword,
-                                                     parsable_class_keyword,
-                                                     throw_if_unable_to_parse,
-                                                     class_type)
+                input_value = ParsableProperty.parse(input_value, *parse_options)
             func(self, input_value)
 
         return parsable_parse
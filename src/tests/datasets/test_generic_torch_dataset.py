@@ -4,17 +4,27 @@ from ml_ontogenesis.datasets.pytorch_dataset import GenericTorchDataset
 from ml_ontogenesis.datasets.pytorch_dataset_parameters import GenericTorchDatasetParameters
 
 
-@pytest.fixture
+def build_dataset(parameters: GenericTorchDatasetParameters) -> GenericTorchDataset:
+    dataset = GenericTorchDataset(raw_dataset=pd.DataFrame({'col1': [1, 2, 3]}))
+    dataset.dataset_parameters = parameters
+    return dataset
+
+
+# --- the fixtures are only read by the tests, so they are built once per module ---
+@pytest.fixture(scope='module')
 def mock_dataset_parameters() -> GenericTorchDatasetParameters:
     parameters = GenericTorchDatasetParameters(version='0.0.1', dataset_directory='/home/mithrandir/')
     return parameters
 
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def torch_dataset_instance(mock_dataset_parameters: GenericTorchDatasetParameters) -> GenericTorchDataset:
-    dataset = GenericTorchDataset(raw_dataset=pd.DataFrame({'col1': [1, 2, 3]}))
-    dataset.dataset_parameters = mock_dataset_parameters
-    return dataset
+    return build_dataset(mock_dataset_parameters)
+
+
+@pytest.fixture
+def mutable_torch_dataset_instance(mock_dataset_parameters: GenericTorchDatasetParameters) -> GenericTorchDataset:
+    return build_dataset(mock_dataset_parameters)
 
 
 def test_has_dataset_parameters(torch_dataset_instance: GenericTorchDataset):
@@ -30,10 +40,10 @@ def test_has_raw_dataset(torch_dataset_instance: GenericTorchDataset):
     assert torch_dataset_instance.has_raw_dataset, f"Raw dataset should be recognized as set."
 
 
-def test_raw_dataset_assignment(torch_dataset_instance: GenericTorchDataset):
+def test_raw_dataset_assignment(mutable_torch_dataset_instance: GenericTorchDataset):
     df = pd.DataFrame({'col1': [1, 2, 3]})
-    torch_dataset_instance.raw_dataset = df
-    assert torch_dataset_instance.raw_dataset.equals(df), f"Raw dataset should be correctly assigned."
+    mutable_torch_dataset_instance.raw_dataset = df
+    assert mutable_torch_dataset_instance.raw_dataset.equals(df), f"Raw dataset should be correctly assigned."
 
 
 """
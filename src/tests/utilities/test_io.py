@@ -0,0 +1,141 @@
+import json
+import time
+import pytest
+from ml_ontogenesis.utilities import io
+from ml_ontogenesis.datasets.pytorch_dataset_parameters import GenericTorchDatasetParameters
+
+
+@pytest.mark.parametrize("value", [{'a': [1, 2.5, None, True, 'x']}, (1, 2), {'n': [2 ** 70]}, [], "text"])
+def test_pickled_json_round_trip(value):
+    assert io.from_pickled_json(io.to_pickled_json(value)) == value, f"Value should survive a round trip."
+
+
+def test_pickled_json_round_trip_of_parsable():
+    parameters = GenericTorchDatasetParameters(version='0.0.1', dataset_directory='/home/mithrandir/')
+    decoded = io.from_pickled_json(io.to_pickled_json(parameters))
+    assert isinstance(decoded, GenericTorchDatasetParameters), f"The parameters class should be restored."
+    assert decoded.to_dict() == parameters.to_dict(), f"The restored parameters should hold the same values."
+
+
+@pytest.mark.parametrize("kwargs", [{}, {'indent': 2, 'sort_keys': True}, {'indent': 4}, {'sync': True}])
+def test_json_file_round_trip(tmp_path, kwargs):
+    value = {'b': [1, 2.5, None], 'a': {'nested': 'text'}, 'nan': float('inf'), 'large': 2 ** 70}
+    file = tmp_path / "values.json"
+    io.write_to_json_file(file, value, **kwargs)
+    assert io.read_json_file(file) == value, f"Value should survive being written to and read from a file."
+
+
+def test_json_str_of_the_json_module_on_request():
+    value = {'a': [1, 1e16, 'caf\u00e9'], 'b': {}}
+    assert io.from_json_str(io.to_json_str(value)) == value, f"Value should survive a round trip."
+    assert io.to_json_str(value, ensure_ascii=True) == json.dumps(value, ensure_ascii=True), \
+        f"Arguments orjson does not support should produce the output of the json module."
+
+
+def test_file_exists_and_is_dir(tmp_path):
+    file = tmp_path / "file.txt"
+    assert not io.file_exists(file), f"A missing file should not exist."
+    file.write_text("text")
+    assert io.file_exists(file) and io.file_exists(str(file)), f"A created file should exist."
+    assert not io.is_dir(file), f"A file should not be a directory."
+    assert io.is_dir(tmp_path) and io.is_dir(str(tmp_path)), f"A directory should be recognized."
+    file.unlink()
+    assert not io.file_exists(file), f"A removed file should not exist."
+
+
+def test_subdirectory_listing(tmp_path):
+    (tmp_path / "first").mkdir()
+    (tmp_path / "file.txt").write_text("text")
+    (tmp_path / "second").mkdir()
+    time.sleep(0.01)
+    # --- changing the mode updates the ctime of the directory ---
+    (tmp_path / "second").chmod(0o755)
+    assert sorted(io.all_subdirs_of(str(tmp_path))) == [str(tmp_path / "first"), str(tmp_path / "second")], \
+        f"Only the directories should be listed."
+    assert io.get_latest_folder(str(tmp_path)) == str(tmp_path / "second"), f"The newest directory should be found."
+
+
+def test_get_all_folders_with_subfolder(tmp_path):
+    (tmp_path / "run_1" / "checkpoints" / "epoch_1").mkdir(parents=True)
+    (tmp_path / "run_1" / "checkpoints" / "epoch_2" / "checkpoints").mkdir(parents=True)
+    (tmp_path / "run_1" / "checkpoints" / "notes.txt").write_text("not a folder")
+    (tmp_path / "run_2" / "logs").mkdir(parents=True)
+    (tmp_path / "nested" / "run_3" / "checkpoints" / "epoch_3").mkdir(parents=True)
+    (tmp_path / "run_4").mkdir()
+    (tmp_path / "run_4" / "checkpoints").write_text("not a folder")
+    assert sorted(io.get_all_folders_with_subfolder(str(tmp_path), "checkpoints")) == \
+        [str(tmp_path / "nested" / "run_3" / "checkpoints" / "epoch_3"),
+         str(tmp_path / "run_1" / "checkpoints" / "epoch_1"), str(tmp_path / "run_1" / "checkpoints" / "epoch_2")], \
+        f"The child folders of the folders with the given name should be found, without searching inside them."
+
+
+def test_copy_folder_contents_to(tmp_path):
+    (tmp_path / "source" / "nested").mkdir(parents=True)
+    (tmp_path / "source" / "nested" / "file.txt").write_text("text")
+    (tmp_path / "destination").mkdir()
+    io.copy_folder_contents_to(str(tmp_path / "source"), str(tmp_path / "destination"))
+    assert (tmp_path / "destination" / "nested" / "file.txt").read_text() == "text", f"Contents should be copied."
+
+
+def test_cached_stats_only_remember_existing_paths(tmp_path):
+    file = tmp_path / "file.txt"
+    with io.cached_stats():
+        assert not io.file_exists(file), f"A missing file should not exist."
+        file.write_text("text")
+        assert io.file_exists(file), f"A file created inside the block should be found."
+        file.unlink()
+        assert io.file_exists(file), f"An existing file should be remembered inside the block."
+        io.invalidate_stat_cache()
+        assert not io.file_exists(file), f"A removed file should not exist once the cache is invalidated."
+        file.write_text("text")
+    file.unlink()
+    assert not io.file_exists(file), f"Nothing should be remembered once the block exits."
+
+
+@pytest.mark.parametrize("path, expected", [("runs/experiment/model.pt", "experiment"), ("model.pt", "./"),
+                                            ("/model.pt", "./"), ("runs/experiment", "experiment"),
+                                            ("runs/experiment/", "experiment")])
+def test_path_to_dir(path, expected):
+    assert io.path_to_dir(path) == expected, f"The folder of the path should be extracted."
+
+
+def test_path_to_dir_of_existing_directory(tmp_path):
+    assert io.path_to_dir(str(tmp_path)) == str(tmp_path), f"An existing directory should be returned as is."
+    with pytest.raises(RuntimeError):
+        io.path_to_dir("")
+
+
+def test_msgpack_round_trip_of_parsable():
+    pytest.importorskip("msgpack")
+    parameters = GenericTorchDatasetParameters(version='0.0.1', dataset_directory='/home/mithrandir/')
+    decoded = io.from_msgpack(io.to_msgpack({'parameters': parameters, 'values': [1, 2.5, None]}))
+    assert decoded['values'] == [1, 2.5, None], f"Plain data should survive a round trip."
+    assert isinstance(decoded['parameters'], GenericTorchDatasetParameters), f"The parameters should be restored."
+    assert decoded['parameters'].to_dict() == parameters.to_dict(), f"The parameters should hold the same values."
+
+
+def test_file_exists_many(tmp_path):
+    (tmp_path / "first.txt").write_text("text")
+    (tmp_path / "folder").mkdir()
+    paths = [tmp_path / "first.txt", str(tmp_path / "folder"), tmp_path / "missing.txt",
+             str(tmp_path / "missing" / "file.txt"), str(tmp_path) + "/", None]
+    assert io.file_exists_many(paths) == {path: io.file_exists(path) for path in paths}, \
+        f"The batched check should agree with file_exists."
+
+
+@pytest.mark.parametrize("kwargs", [{}, {'indent': 2}, {'indent': 4}])
+def test_raw_json_is_embedded_verbatim(tmp_path, kwargs):
+    value = {'raw': io.RawJSON('{"cached": [1, 2]}'), 'items': [io.RawJSON('3'), 'text'], 'nan': float('nan')}
+    decoded = io.from_json_str(io.to_json_str(value, **kwargs))
+    assert decoded['raw'] == {'cached': [1, 2]} and decoded['items'] == [3, 'text'], \
+        f"Raw JSON should be embedded as a document rather than a string."
+    file = tmp_path / "raw.json"
+    io.write_to_json_file(file, value, **kwargs)
+    assert io.read_json_file(file)['raw'] == {'cached': [1, 2]}, f"Raw JSON should be written verbatim."
+
+
+def test_json_bytes_match_json_strings():
+    value = {'a': [1, 2.5, None], 'nan': float('nan'), 'large': 2 ** 70}
+    assert io.to_json_bytes(value) == io.to_json_str(value).encode(), f"The bytes should encode the same document."
+    assert io.to_pickled_json_bytes(value) == io.to_pickled_json(value).encode(), \
+        f"The pickled bytes should encode the same document."
@@ -0,0 +1,150 @@
+import logging
+import multiprocessing
+import sys
+import pytest
+from ml_ontogenesis.utilities import loghandler
+
+
+def test_stream_handler_is_unbuffered_by_default(monkeypatch):
+    monkeypatch.delenv("ML_ONTOGENESIS_BUFFERED_LOG", raising=False)
+    handler = loghandler._create_stream_handler()
+    assert type(handler) is logging.StreamHandler, f"Records should not be buffered unless requested."
+
+
+def _log_from_child(logger_name: str):
+    logging.getLogger(logger_name).info("from child")
+
+
+@pytest.mark.skipif("fork" not in multiprocessing.get_all_start_methods(), reason="requires fork")
+def test_buffered_records_survive_a_fork(tmp_path):
+    file = tmp_path / "log.txt"
+    handler = loghandler._BufferedStreamHandler(open(file, "w"))
+    logger = logging.getLogger("ml-ontogenesis-test-fork")
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    logger.addHandler(handler)
+    try:
+        logger.info("from parent")
+        process = multiprocessing.get_context("fork").Process(target=_log_from_child, args=(logger.name,))
+        process.start()
+        process.join()
+        assert file.read_text().splitlines() == ["from parent", "from child"], \
+            f"The parent should flush before forking and the child should flush every record."
+    finally:
+        logger.removeHandler(handler)
+        handler.close()
+
+
+class _CollectingHandler(logging.Handler):
+    def __init__(self):
+        super().__init__()
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+def _capture_exit_callbacks(monkeypatch) -> list:
+    callbacks = []
+    monkeypatch.setattr(loghandler.atexit, 'register', callbacks.append)
+    return callbacks
+
+
+def test_queued_records_reach_the_handler_and_the_listener_stops_at_exit(monkeypatch):
+    callbacks = _capture_exit_callbacks(monkeypatch)
+    handler = _CollectingHandler()
+    queue_handler = loghandler._start_queue_listener(handler)
+    assert isinstance(queue_handler, loghandler._BlockingQueueHandler), f"Records should only be enqueued."
+    logger = logging.getLogger("ml-ontogenesis-test-queue")
+    logger.propagate = False
+    logger.addHandler(queue_handler)
+    try:
+        for index in range(100):
+            logger.warning("record %d", index)
+        assert len(callbacks) == 1, f"The listener should be stopped when the interpreter exits."
+        callbacks[0]()
+        assert handler.messages == ["record %d" % index for index in range(100)], \
+            f"Every queued record should be emitted, in order, once the listener is stopped."
+    finally:
+        logger.removeHandler(queue_handler)
+
+
+def test_create_logger_selects_the_handler(monkeypatch, tmp_path):
+    callbacks = _capture_exit_callbacks(monkeypatch)
+    monkeypatch.delenv("ML_ONTOGENESIS_ASYNC_LOG", raising=False)
+    monkeypatch.delenv("ML_ONTOGENESIS_BUFFERED_LOG", raising=False)
+    [handler] = loghandler._create_logger("ml-ontogenesis-test-default").handlers
+    assert type(handler) is logging.StreamHandler, f"A plain stream handler should be used by default."
+    assert loghandler._create_logger("ml-ontogenesis-test-default").handlers == [handler], \
+        f"A logger that already has a handler should not get another one."
+
+    monkeypatch.setenv("ML_ONTOGENESIS_ASYNC_LOG", "1")
+    [handler] = loghandler._create_logger("ml-ontogenesis-test-async").handlers
+    assert isinstance(handler, loghandler._BlockingQueueHandler), f"The async variable should enable the queue."
+    for callback in callbacks:
+        callback()
+    monkeypatch.delenv("ML_ONTOGENESIS_ASYNC_LOG")
+
+    monkeypatch.setenv("ML_ONTOGENESIS_BUFFERED_LOG", "1")
+    with open(tmp_path / "stderr.txt", "w") as stderr:
+        monkeypatch.setattr(sys, 'stderr', stderr)
+        [handler] = loghandler._create_logger("ml-ontogenesis-test-buffered").handlers
+        assert isinstance(handler, loghandler._BufferedStreamHandler), \
+            f"The buffered variable should batch the writes to a non-interactive stderr."
+        handler.close()
+
+
+def test_log_and_raise_records_the_location_of_the_caller():
+    with pytest.raises(ValueError) as error:
+        loghandler.log_and_raise(ValueError, "bad ", 1)
+    message = str(error.value)
+    assert message.endswith(" --- bad 1") and "test_loghandler.py" in message, \
+        f"The message should be prefixed with the location of the caller."
+    assert "[test_log_and_raise_records_the_location_of_the_caller]" in message, \
+        f"The message should name the calling function."
+    assert error.value.__cause__ is None, f"No cause should be chained unless one is given."
+
+
+def test_log_and_raise_skips_the_location_when_errors_are_not_logged():
+    level = loghandler.get_logger().level
+    loghandler.set_log_level(loghandler.CRITICAL)
+    try:
+        with pytest.raises(ValueError) as error:
+            loghandler.log_and_raise(ValueError, "bad ", 1)
+    finally:
+        loghandler.set_log_level(level)
+    assert str(error.value) == "bad 1", f"Only the concatenated message should be raised."
+
+
+def test_log_and_raise_chains_the_cause():
+    cause = KeyError('missing')
+    with pytest.raises(RuntimeError) as error:
+        loghandler.log_and_raise(RuntimeError, "lookup failed", cause=cause)
+    assert error.value.__cause__ is cause, f"The given cause should be chained."
+
+
+@pytest.mark.parametrize("name, level", [('debug', logging.DEBUG), ('info', logging.INFO),
+                                         ('warning', logging.WARNING), ('error', logging.ERROR),
+                                         ('critical', logging.CRITICAL)])
+def test_level_functions(name, level):
+    function = getattr(loghandler, name)
+    logger = loghandler.get_logger()
+    previous_level = logger.level
+    records = []
+    handler = logging.Handler()
+    handler.emit = records.append
+    logger.addHandler(handler)
+    try:
+        loghandler.set_log_level(logging.DEBUG)
+        assert function("value ", 1) == "value 1", f"The concatenated message should be returned."
+        message = function("located", record_location=True)
+        assert "test_loghandler.py" in message and "[test_level_functions]" in message, \
+            f"The location should be that of the caller."
+        emitted = [(record.levelno, record.getMessage()) for record in records]
+        assert emitted == [(level, "value 1"), (level, message)], f"The records should be logged at the function level."
+        loghandler.set_log_level(level + 1)
+        assert function("hidden") == "", f"Nothing should be logged below the level of the logger."
+        assert len(records) == 2, f"A disabled level should not emit records."
+    finally:
+        logger.removeHandler(handler)
+        loghandler.set_log_level(previous_level)
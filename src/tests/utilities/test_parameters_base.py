@@ -0,0 +1,72 @@
+import pytest
+from ml_ontogenesis.utilities import ParametersBase, io
+from ml_ontogenesis.datasets.pytorch_dataset_parameters import GenericTorchDatasetParameters
+
+
+class ExtendedParameters(GenericTorchDatasetParameters):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.history = {'losses': [0.5, 0.25]}
+
+
+def test_copy_updates_only_the_copy():
+    parameters = GenericTorchDatasetParameters(version='0.0.1', dataset_directory='/home/mithrandir/')
+    copied = parameters.copy(False, dataset_directory='/home/gandalf/')
+    assert copied.dataset_directory == '/home/gandalf/', f"The copy should hold the updated value."
+    assert parameters.dataset_directory == '/home/mithrandir/', f"The original should keep its value."
+    assert copied.version == parameters.version, f"Values that are not updated should be copied."
+    copied._serializable_attributes.append('extra')
+    assert 'extra' not in parameters._serializable_attributes, f"The registered attributes should not be shared."
+
+
+def test_copy_deep_copies_instance_attributes():
+    parameters = ExtendedParameters(version='0.0.1')
+    copied = parameters.copy(True)
+    assert copied.history == parameters.history, f"Instance attributes should be copied."
+    copied.history['losses'].append(0.125)
+    assert parameters.history['losses'] == [0.5, 0.25], f"Instance attributes should be deep copied."
+
+
+class CountingParameters(GenericTorchDatasetParameters):
+    __slots__ = ('copies',)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.copies = 0
+
+    def __deepcopy__(self, memo):
+        copied = CountingParameters(version=self.version, dataset_directory=self.dataset_directory)
+        copied.copies = self.copies + 1
+        return copied
+
+
+def test_copy_respects_custom_deepcopy():
+    parameters = CountingParameters(version='0.0.1', dataset_directory='/home/mithrandir/')
+    copied = parameters.copy(False, dataset_directory='/home/gandalf/')
+    assert copied.copies == 1, f"A custom __deepcopy__ should be used for the copy."
+    assert copied.dataset_directory == '/home/gandalf/', f"The copy should still be updated."
+
+
+def test_create_parameters_from_dict_and_str():
+    arguments = {'version': '0.0.1', 'dataset_directory': '/home/mithrandir/'}
+    constructed = ParametersBase.create_parameters('GenericTorchDatasetParameters', arguments)
+    parsed = ParametersBase.create_parameters('GenericTorchDatasetParameters', io.to_json_str(arguments),
+                                              parse_instead_of_construct=True)
+    assert isinstance(constructed, GenericTorchDatasetParameters), f"The named parameters class should be built."
+    assert constructed.to_dict() == parsed.to_dict(), f"Constructing and parsing should give the same parameters."
+    unpickled = ParametersBase.create_parameters('GenericTorchDatasetParameters', constructed.to_json(True),
+                                                 pickled=True)
+    assert unpickled.to_dict() == constructed.to_dict(), f"Pickled parameters should be restored."
+
+
+def test_create_parameters_from_bytes():
+    arguments = {'version': '0.0.1', 'dataset_directory': '/home/mithrandir/'}
+    expected = GenericTorchDatasetParameters(**arguments).to_dict()
+    parsed = ParametersBase.create_parameters('GenericTorchDatasetParameters', io.to_json_bytes(arguments))
+    assert parsed.to_dict() == expected, f"Bytes should be decoded as JSON by default."
+    pytest.importorskip("msgpack")
+    unpacked = ParametersBase.create_parameters('GenericTorchDatasetParameters', io.to_msgpack(arguments),
+                                                format="msgpack")
+    assert unpacked.to_dict() == expected, f"Bytes should be decoded as MessagePack when requested."
+    with pytest.raises(ValueError):
+        ParametersBase.create_parameters('GenericTorchDatasetParameters', io.to_msgpack(arguments), format="yaml")
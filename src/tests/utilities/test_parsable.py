@@ -0,0 +1,432 @@
+import copy
+import enum
+import json
+import numpy as np
+import pytest
+from ml_ontogenesis.utilities import io, properties, Parsable, GenericParsable, ImmutableParsable, LazyParsable, \
+    enum_setter, parsable_setter
+from ml_ontogenesis.datasets.pytorch_dataset_parameters import GenericTorchDatasetParameters
+
+
+class Color(enum.Enum):
+    RED = 1
+    BLUE = 2
+
+
+class Mode(str, enum.Enum):
+    TRAIN = 'train'
+    EVAL = 'eval'
+
+
+class Composite(GenericParsable):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._enum_attributes.extend(['color'])
+        self._parsable_attributes.extend(['child'])
+        self._dict_of_parsables.extend(['children_by_name'])
+        self._list_of_parsables.extend(['children'])
+        self._specialized_attributes.extend(['scale'])
+        self.color = kwargs.get('color')
+        self.child = kwargs.get('child')
+        self.children_by_name = kwargs.get('children_by_name', {})
+        self.children = kwargs.get('children', [])
+        self.scale = kwargs.get('scale', 1.0)
+
+    @property
+    def has_color(self) -> bool:
+        return self._color is not None
+
+    @property
+    def color(self) -> Color:
+        return self._color
+
+    @color.setter
+    @enum_setter(Color)
+    def color(self, input_value):
+        self._color = input_value
+
+    @property
+    def has_child(self) -> bool:
+        return self._child is not None
+
+    @property
+    def child(self) -> GenericTorchDatasetParameters:
+        return self._child
+
+    @child.setter
+    @parsable_setter(throw_if_unable_to_parse=True)
+    def child(self, input_value):
+        self._child = input_value
+
+    @property
+    def children_by_name(self) -> dict:
+        return self._children_by_name
+
+    @children_by_name.setter
+    def children_by_name(self, input_value):
+        self._children_by_name = input_value
+
+    @property
+    def children(self) -> list:
+        return self._children
+
+    @children.setter
+    def children(self, input_value):
+        self._children = input_value
+
+    def scale_encode(self):
+        return {'value': self.scale}
+
+    def scale_decode(self, input_value):
+        self.scale = input_value['value']
+
+
+class UpperCaseColorComposite(Composite):
+    def to_dict_enum(self, output: dict, property_name: str):
+        output[property_name] = getattr(self, property_name).name.lower()
+
+
+class DefaultColorComposite(Composite):
+    def from_dict_enum(self, input_value: dict, property_name: str):
+        setattr(self, property_name, input_value.get(property_name, 'RED'))
+
+
+def build_composite(class_type=Composite) -> Composite:
+    return class_type(version='0.0.1', color='RED',
+                      child=GenericTorchDatasetParameters(version='0.0.2', dataset_directory='/home/mithrandir/'),
+                      children_by_name={'first': GenericTorchDatasetParameters(version='0.0.3')},
+                      children=[GenericTorchDatasetParameters(version='0.0.4')], scale=2.0)
+
+
+def test_split_ordered_and_unordered_attributes():
+    parameters = GenericTorchDatasetParameters(version='0.0.1')
+    parameters._desired_order_of_parsing.extend(['dataset_directory', 'version'])
+    ordered, unordered = parameters.split_ordered_and_unordered_attributes()
+    assert ordered == ['dataset_directory', 'version'], f"The desired order should be kept."
+    assert unordered == ['debug'], f"The remaining attributes should keep their registration order."
+
+
+def test_split_ordered_and_unordered_attributes_with_unknown_attribute():
+    parameters = GenericTorchDatasetParameters(version='0.0.1')
+    parameters._desired_order_of_parsing.append('missing')
+    with pytest.raises(ValueError):
+        parameters.split_ordered_and_unordered_attributes()
+
+
+def test_serialized_dict_and_list():
+    parameters = GenericTorchDatasetParameters(version='0.0.1')
+    values = {'parameters': parameters, 'array': np.arange(3), 'text': 'text'}
+    expected = {'parameters': parameters.to_dict(), 'array': [0, 1, 2], 'text': 'text'}
+    assert GenericParsable.serialized_dict(values) == expected, f"The values should be serialized."
+    assert GenericParsable.serialized_list(list(values.values())) == list(expected.values()), \
+        f"The items should be serialized."
+
+
+def test_to_dict_skips_unassigned_attributes():
+    parameters = GenericTorchDatasetParameters(version='0.0.1')
+    output = parameters.to_dict()
+    assert output['version'] == '0.0.1', f"Assigned attributes should be serialized."
+    assert 'dataset_directory' not in output, f"Unassigned attributes should be skipped."
+
+
+def test_to_dict_of_all_attribute_categories():
+    composite = build_composite()
+    output = composite.to_dict()
+    assert output['color'] == 'RED', f"Enums should be serialized by name."
+    assert output['child'] == composite.child.to_dict(), f"Parsable attributes should be serialized."
+    assert output['children_by_name'] == {'first': composite.children_by_name['first'].to_dict()}, \
+        f"Dictionaries of parsables should be serialized."
+    assert output['children'] == [composite.children[0].to_dict()], f"Lists of parsables should be serialized."
+    assert output['scale'] == {'value': 2.0}, f"Specialized attributes should use their encoder."
+
+
+def test_to_dict_uses_overridden_helpers():
+    assert build_composite(UpperCaseColorComposite).to_dict()['color'] == 'red', \
+        f"A to_dict helper overridden by a subclass should be used."
+
+
+def test_from_dict_round_trip():
+    composite = build_composite()
+    restored = Composite()
+    restored.from_dict(composite.to_dict())
+    assert restored.to_dict() == composite.to_dict(), f"The attributes should survive a round trip."
+    assert isinstance(restored.children[0], GenericTorchDatasetParameters), f"Nested parsables should be parsed."
+
+
+def test_lazy_from_dict_round_trip():
+    composite = build_composite()
+    restored = Composite()
+    restored.from_dict(composite.to_dict(), lazy=True)
+    child = restored.children[0]
+    assert type(child) is LazyParsable and child._real is None, f"Nested parsables should not be parsed yet."
+    assert restored.to_dict() == composite.to_dict(), f"Unparsed stand-ins should serialize to their input."
+    assert isinstance(child, GenericTorchDatasetParameters), f"Stand-ins should pass isinstance checks."
+    assert child.version == '0.0.4', f"Stand-ins should be parsed on first use."
+    assert restored.equals(composite), f"Stand-ins should compare equal to the parsed objects."
+
+
+def test_lazy_stand_ins_compare_like_the_parsed_objects():
+    composite = build_composite()
+    restored = Composite()
+    restored.from_dict(composite.to_dict(), lazy=True)
+    child = restored.children[0]
+    expected = composite.children[0]
+    assert expected.equals(child) and child.equals(expected), f"Equality should not depend on the operand order."
+    real = child._materialize()
+    assert child == real and real == child, f"A stand-in should compare equal to the object it parsed."
+    assert hash(child) == hash(real), f"A stand-in should hash like the object it parsed."
+
+
+def test_deepcopy_of_lazy_from_dict():
+    composite = build_composite()
+    restored = Composite()
+    restored.from_dict(composite.to_dict(), lazy=True)
+    copied = copy.deepcopy(restored)
+    child = copied.children[0]
+    assert type(child) is LazyParsable and child._real is None, f"Unparsed stand-ins should be copied unparsed."
+    assert child._raw is not restored.children[0]._raw, f"The serialized dictionary should be deep copied."
+    assert copied.equals(composite), f"The copy should compare equal to the parsed objects."
+    stand_in = restored.children[0]
+    stand_in._materialize()
+    assert type(copy.deepcopy(stand_in)) is GenericTorchDatasetParameters, \
+        f"A parsed stand-in should copy the parsed object."
+
+
+def test_load_from_json_streaming(tmp_path):
+    composite = build_composite()
+    file = composite.save_to_json(tmp_path / "composite.json", pickled=False)
+    restored = Composite()
+    restored.load_from_json_streaming(file)
+    assert restored.to_dict() == composite.to_dict(), f"The attributes should survive a streamed round trip."
+
+
+class _FakeIjson:
+    def __init__(self):
+        self.calls = []
+
+    def kvitems(self, file, prefix, use_float=False):
+        self.calls.append((prefix, use_float))
+        yield from json.load(file).items()
+
+
+def test_load_from_json_streaming_with_ijson(tmp_path, monkeypatch):
+    fake_ijson = _FakeIjson()
+    monkeypatch.setattr(io, 'ijson', fake_ijson)
+    composite = build_composite()
+    file = composite.save_to_json(tmp_path / "composite.json", pickled=False)
+    restored = Composite()
+    restored.load_from_json_streaming(file)
+    assert fake_ijson.calls == [('', True)], f"The top level items should be read incrementally."
+    assert restored.to_dict() == composite.to_dict(), f"The attributes should survive a streamed round trip."
+
+
+def test_from_dict_items_populates_attributes_as_they_arrive():
+    restored = build_composite(DefaultColorComposite)
+
+    def items():
+        yield 'version', '0.0.9'
+        assert restored.version == '0.0.9', f"An attribute should be populated before the next pair is read."
+        yield 'unknown', 'ignored'
+        yield 'scale', {'value': 3.0}
+    restored.from_dict_items(items())
+    assert restored.scale == 3.0, f"Every pair should be populated."
+    assert restored.color is Color.RED, f"Overridden handlers of missing attributes should still be called."
+
+
+def test_from_dict_items_keeps_the_desired_order_of_parsing():
+    restored = build_composite()
+    restored._desired_order_of_parsing.extend(['color'])
+
+    def items():
+        yield 'version', '0.0.9'
+        assert restored.version == '0.0.1', f"Pairs should be held back until the ordered attributes arrived."
+        yield 'color', 'BLUE'
+        assert restored.version == '0.0.9', f"Held pairs should be populated once the ordered attributes arrived."
+        yield 'scale', {'value': 3.0}
+    restored.from_dict_items(items())
+    assert restored.color is Color.BLUE and restored.scale == 3.0, f"Every pair should be populated."
+
+
+def test_subclass_must_implement_required_methods():
+    with pytest.raises(TypeError):
+        class Incomplete(Parsable):
+            def to_dict(self) -> dict:
+                return {}
+
+    class AbstractParsable(Parsable, abstract=True):
+        pass
+    assert issubclass(AbstractParsable, Parsable), f"Abstract subclasses should be allowed to be incomplete."
+
+
+def test_freeze_registration():
+    composite = build_composite()
+    expected = composite.to_dict()
+    composite.freeze_registration()
+    assert type(composite._enum_attributes) is tuple, f"The registration lists should be converted to tuples."
+    assert composite.to_dict() == expected, f"Freezing the registration should not change the serialization."
+    assert composite.registration_key() is composite.registration_key(), \
+        f"A frozen instance should reuse its registration key."
+    restored = Composite()
+    restored.freeze_registration()
+    restored.from_dict(expected)
+    assert restored.equals(composite), f"A frozen instance should still be deserialized."
+
+
+class ImmutableComposite(ImmutableParsable):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._list_of_parsables.extend(['children'])
+        self.children = kwargs.get('children', [])
+
+    @property
+    def children(self) -> list:
+        return self._children
+
+    @children.setter
+    def children(self, input_value):
+        self._children = input_value
+
+
+def test_immutable_parsable_equals():
+    first = ImmutableComposite(version='0.0.1', children=[GenericTorchDatasetParameters(version='0.0.2')])
+    second = ImmutableComposite(version='0.0.1', children=[GenericTorchDatasetParameters(version='0.0.2')])
+    different = ImmutableComposite(version='0.0.1', children=[GenericTorchDatasetParameters(version='0.0.3')])
+    assert first.equals(second) and first.equals(second, atol=0.0), f"Identical objects should be equal."
+    assert not first.equals(different), f"Objects with different attributes should not be equal."
+    with pytest.raises(AttributeError):
+        first.version = '0.0.4'
+
+
+@pytest.mark.parametrize("container", [list, tuple, set])
+def test_to_dict_of_list_of_parsables_containers(container):
+    composite = build_composite()
+    expected = [composite.children[0].to_dict()]
+    composite.children = container(composite.children)
+    assert composite.to_dict()['children'] == expected, f"Every supported container should serialize to a list."
+    output = dict()
+    composite.to_dict_list_of_parsable(output, 'children')
+    assert output['children'] == expected, f"The to_dict helper should serialize every supported container."
+
+
+def test_defined_classes_resolve_without_import():
+    class LocalParameters(GenericTorchDatasetParameters):
+        pass
+    serialized = LocalParameters(version='0.0.1').to_dict()
+    restored = properties.ParsableProperty.parse(serialized, throw_if_unable_to_parse=True)
+    assert type(restored) is LocalParameters, f"A defined class should be resolved from its registration."
+
+
+class ParallelComposite(Composite):
+    _releases_gil = True
+    _parallel_to_dict_threshold = 0
+
+
+def test_parallel_to_dict():
+    expected = build_composite().to_dict()
+    output = build_composite(ParallelComposite).to_dict()
+    expected['parsable_type'] = ParallelComposite.__name__
+    assert list(output.items()) == list(expected.items()), f"The parallel serialization should keep the same order."
+
+
+def test_to_dict_of_sets_is_sorted():
+    composite = build_composite()
+    composite._serializable_attributes.append('tags')
+    composite.tags = frozenset(['c', 'a', 'b'])
+    assert composite.to_dict()['tags'] == ['a', 'b', 'c'], f"Sets should be serialized in sorted order."
+
+
+def test_to_json_bytes():
+    composite = build_composite()
+    restored = Composite()
+    restored.from_json(composite.to_json_bytes(pickled=False).decode())
+    assert restored.equals(composite), f"The attributes should survive a round trip through bytes."
+    assert GenericParsable.from_pickled_json(composite.to_json_bytes(pickled=True)).equals(composite), \
+        f"The pickled class should survive a round trip through bytes."
+
+
+def test_to_dict_skips_unassigned_version():
+    assert 'version' not in GenericTorchDatasetParameters().to_dict(), f"An unassigned version should be skipped."
+
+
+def test_from_dict_of_empty_input_keeps_attributes():
+    composite = build_composite()
+    expected = composite.to_dict()
+    composite.from_dict({})
+    assert composite.to_dict() == expected, f"An empty input should not change any attribute."
+    composite._desired_order_of_parsing.append('missing')
+    with pytest.raises(ValueError):
+        composite.from_dict({})
+
+
+def test_from_dict_of_partial_input_only_updates_present_attributes():
+    composite = build_composite()
+    expected = composite.to_dict()
+    expected['color'] = 'BLUE'
+    composite.from_dict({'color': 'BLUE'})
+    assert composite.to_dict() == expected, f"Only the attributes present in the input should be populated."
+
+
+class NumericComposite(Composite):
+    _numeric_serializable_attributes = {'weights': np.float32}
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._serializable_attributes.extend(['weights'])
+        self.weights = kwargs.get('weights')
+
+    @property
+    def weights(self) -> np.ndarray:
+        return self._weights
+
+    @weights.setter
+    def weights(self, input_value):
+        self._weights = input_value
+
+
+def test_numeric_attributes_are_deserialized_as_arrays():
+    composite = build_composite(NumericComposite)
+    composite.weights = np.arange(4, dtype=np.float32)
+    restored = NumericComposite()
+    restored.from_dict(composite.to_dict())
+    assert restored.weights.dtype == np.float32, f"Numeric attributes should be deserialized with their dtype."
+    assert restored.equals(composite), f"Numeric attributes should survive a round trip."
+    updated = NumericComposite()
+    updated.update(False, composite.to_dict())
+    assert isinstance(updated.weights, np.ndarray), f"Numeric attributes should be updated as arrays."
+
+
+@pytest.mark.parametrize("input_value", [{}, {'scale': {'value': 3.0}}])
+def test_from_dict_calls_overridden_handlers_of_missing_attributes(input_value):
+    composite = build_composite(DefaultColorComposite)
+    composite.color = 'BLUE'
+    composite.from_dict(input_value)
+    assert composite.color is Color.RED, f"An overridden handler should be called for a missing attribute."
+
+
+def test_resolve_class_follows_redefined_classes():
+    def define():
+        class Redefined(GenericParsable):
+            pass
+        return Redefined
+    first = define()
+    assert properties.resolve_class(__name__, 'Redefined') is first, f"A registered class should be resolved."
+    second = define()
+    assert properties.resolve_class(__name__, 'Redefined') is second, \
+        f"A redefined class should resolve to its latest definition."
+
+
+@pytest.mark.parametrize("input_value, expected", [('BLUE', Color.BLUE), (1, Color.RED), (Color.BLUE, Color.BLUE),
+                                                   (None, None), (['RED', 2], [Color.RED, Color.BLUE])])
+def test_enum_parse(input_value, expected):
+    assert properties.enum_parse(Color, input_value) == expected, f"The value should resolve to its member."
+
+
+@pytest.mark.parametrize("input_value", ['GREEN', 3, 2.0, ['RED', 'GREEN']])
+def test_enum_parse_rejects_unknown_values(input_value):
+    with pytest.raises(TypeError):
+        properties.enum_parse(Color, input_value)
+
+
+def test_enum_parse_of_str_based_enums():
+    assert properties.enum_parse(Mode, Mode.EVAL) is Mode.EVAL, f"A member should be returned as is."
+    assert properties.enum_parse(Mode, 'TRAIN') is Mode.TRAIN, f"A name should resolve to its member."
@@ -0,0 +1,200 @@
+import copy
+import importlib.metadata
+import pickle
+import threading
+import pytest
+from ml_ontogenesis.utilities import plugin
+from ml_ontogenesis.datasets.pytorch_dataset_parameters import GenericTorchDatasetParameters
+
+
+class Shape(plugin.PluginBase):
+    plugin_property_name = 'shape_type'
+    plugin_module_property_name = None
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.sides = kwargs.get('sides', 0)
+
+
+class Square(Shape):
+    pass
+
+
+def test_subclasses_register_when_defined():
+    assert Shape.has_registered_class('Square'), f"Subclasses should be registered when they are defined."
+    assert Shape.get_class('Square') is Square, f"Registered subclasses should be returned by name."
+    assert plugin.PluginBase.get_class('GenericTorchDatasetParameters') is GenericTorchDatasetParameters, \
+        f"Subclasses defined in other modules should be registered on import."
+
+
+def test_construct_from_parameters():
+    square = Shape.construct_from_parameters({'shape_type': 'Square'}, sides=4)
+    assert isinstance(square, Square) and square.sides == 4, f"The named plugin should be constructed."
+    with pytest.raises(RuntimeError):
+        Shape.construct_from_parameters({'sides': 4})
+
+
+class Animal(plugin.PluginBase):
+    _registered_plugins = dict()
+
+
+class Dog(Animal):
+    pass
+
+
+def test_separate_registries_only_hold_their_subclasses():
+    assert Animal.get_class('Dog') is Dog, f"A separate registry should hold the subclasses."
+    assert Animal.get_class('Square') is None, f"A separate registry should not hold unrelated plugins."
+    assert plugin.PluginBase.get_class('Dog') is Dog, f"The registry of PluginBase should hold every plugin."
+    Shape.add_registry()
+    assert Shape.get_class('Square') is Square and Shape.get_class('Dog') is None, \
+        f"Adding a registry should collect the subclasses defined so far."
+
+
+class SlottedShape(plugin.PluginBase):
+    __slots__ = ('sides',)
+
+
+def test_slotted_plugins_have_no_instance_dict():
+    assert not hasattr(SlottedShape(), '__dict__'), f"Slotted plugins should not carry an instance dictionary."
+
+
+def test_plugin_keywords_require_a_specific_base_class():
+    with pytest.raises(RuntimeError):
+        plugin.PluginBase.gather_plugin_class_and_module_keywords()
+    assert Shape.gather_plugin_class_and_module_keywords() == ('shape_type', None), \
+        f"The keywords should be gathered from the plugin class."
+
+
+class ShapeParameters:
+    def __init__(self, shape_type=None):
+        self._shape_type = shape_type
+
+    @property
+    def has_shape_type(self) -> bool:
+        return self._shape_type is not None
+
+    @property
+    def shape_type(self) -> str:
+        return self._shape_type
+
+
+def test_construct_from_parameters_object():
+    assert isinstance(Shape.construct_from_parameters(ShapeParameters('Square')), Square), \
+        f"The plugin named by a parameters object should be constructed."
+    with pytest.raises(RuntimeError):
+        Shape.construct_from_parameters(ShapeParameters())
+
+
+def test_construct_lazy_defers_the_lookup():
+    missing = Shape.construct_lazy('Missing', class_module='ml_ontogenesis.missing_module')
+    with pytest.raises(RuntimeError):
+        missing.sides
+    square = Shape.construct_lazy('Square', sides=4)
+    assert square.sides == 4, f"The plugin should be constructed when one of its attributes is used."
+    square.sides = 5
+    assert isinstance(square._materialize(), Square) and square.sides == 5, \
+        f"Attributes should be assigned on the constructed plugin."
+
+
+class Path(Shape):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.points = kwargs.get('points', [])
+
+    def __len__(self):
+        return len(self.points)
+
+    def __getitem__(self, index):
+        return self.points[index]
+
+    def __iter__(self):
+        return iter(self.points)
+
+    def __call__(self, scale):
+        return [point * scale for point in self.points]
+
+    def __eq__(self, other):
+        return isinstance(other, Path) and self.points == other.points
+
+    def __hash__(self):
+        return hash(tuple(self.points))
+
+
+def test_lazy_plugins_pass_isinstance_checks_without_being_constructed():
+    path = Shape.construct_lazy('Path', points=[1, 2, 3])
+    assert isinstance(path, Path) and type(path) is plugin.LazyPlugin, f"The stand-in should pass isinstance checks."
+    assert path._real is None, f"An isinstance check should not construct the plugin."
+
+
+def test_lazy_plugins_forward_special_methods():
+    path = Shape.construct_lazy('Path', points=[1, 2, 3])
+    assert len(path) == 3 and path[0] == 1 and list(path) == [1, 2, 3], f"Container methods should be forwarded."
+    assert path(2) == [2, 4, 6], f"Calls should be forwarded."
+    assert path and not Shape.construct_lazy('Path'), f"Truth tests should be forwarded."
+    assert path == Path(points=[1, 2, 3]) and path == Shape.construct_lazy('Path', points=[1, 2, 3]), \
+        f"Comparisons should be forwarded."
+    assert hash(path) == hash(Path(points=[1, 2, 3])), f"Hashing should be forwarded."
+
+
+def test_lazy_plugins_copy_the_constructed_plugin():
+    path = Shape.construct_lazy('Path', points=[1, 2, 3])
+    copied = copy.deepcopy(path)
+    assert type(copied) is Path and copied == path, f"A deep copy should copy the constructed plugin."
+    assert copied.points is not path.points, f"A deep copy should not share the attributes."
+    assert type(copy.copy(path)) is Path, f"A shallow copy should copy the constructed plugin."
+    assert pickle.loads(pickle.dumps(Shape.construct_lazy('Path', points=[1]))) == Path(points=[1]), \
+        f"Pickling should store the constructed plugin."
+
+
+def test_failed_imports_are_not_retried():
+    assert Shape.get_class('Missing', class_module='ml_ontogenesis.missing_module') is None, \
+        f"A class that cannot be imported should not be returned."
+    assert ('ml_ontogenesis.missing_module', 'Missing') in plugin._failed_imports, \
+        f"The import of a missing module should not be attempted again."
+    with pytest.raises(RuntimeError) as error:
+        Shape.lookup('Missing', 'ml_ontogenesis.missing_module')
+    assert isinstance(error.value.__cause__, ModuleNotFoundError), f"The import error should be chained."
+    plugin.clear_failed_imports()
+    assert not plugin._failed_imports, f"The missing modules should be forgotten once cleared."
+
+
+def test_missing_classes_of_existing_modules_are_retried():
+    assert Shape.get_class('Missing', class_module=__name__) is None, \
+        f"A class missing from its module should not be returned."
+    assert (__name__, 'Missing') not in plugin._failed_imports, \
+        f"Only the imports of missing modules should be remembered."
+
+
+def test_plugins_is_a_read_only_view():
+    plugins = Animal.plugins()
+    assert dict(plugins) == {'Dog': Dog}, f"The view should hold the registered plugins."
+    with pytest.raises(TypeError):
+        plugins['Cat'] = Dog
+
+
+def test_plugins_are_created_without_a_metaclass():
+    assert type(plugin.PluginBase) is type and type(Square) is type, f"Plugins should not use a metaclass."
+
+
+def test_installed_plugins_are_loaded_from_entry_points(monkeypatch):
+    entry_point = importlib.metadata.EntryPoint(name='Polygon', value=__name__ + ':Square',
+                                                group='ml_ontogenesis.plugins.Shape')
+    monkeypatch.setattr(importlib.metadata, 'entry_points',
+                        lambda group: [entry_point] if group == entry_point.group else [])
+    plugin._plugin_entry_points.cache_clear()
+    try:
+        assert Shape.get_class('Polygon') is Square, f"Advertised plugins should be loaded from their entry point."
+        assert Animal.get_class('Polygon') is None, f"Entry points should only serve their base class."
+    finally:
+        plugin._plugin_entry_points.cache_clear()
+
+
+def test_plugins_defined_from_threads_are_all_registered():
+    names = ['ThreadedShape%d' % index for index in range(32)]
+    threads = [threading.Thread(target=type, args=(name, (Shape,), {})) for name in names]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert all(Shape.has_registered_class(name) for name in names), f"Every plugin should be registered."